@@ -0,0 +1,143 @@
+"""
+Compares the JSON codecs on payloads shaped like the ones discohook exchanges with discord.
+
+    python -m benchmarks.json_codec
+"""
+
+import timeit
+
+from discohook.codec import JSONCodec
+
+USER = {
+    "id": "1041234567890123456",
+    "username": "someone",
+    "global_name": "Someone",
+    "discriminator": "0",
+    "avatar": "a_1269e74af4df7417b13759eae50c83dc",
+    "public_flags": 64,
+}
+
+INTERACTION = {
+    "id": "1201234567890123456",
+    "application_id": "1101234567890123456",
+    "type": 2,
+    "token": "aW50ZXJhY3Rpb246MTIwMTIzNDU2Nzg5MDEyMzQ1Njp" * 4,
+    "version": 1,
+    "guild_id": "1001234567890123456",
+    "channel_id": "1011234567890123456",
+    "channel": {
+        "id": "1011234567890123456",
+        "type": 0,
+        "name": "general",
+        "guild_id": "1001234567890123456",
+        "parent_id": "1021234567890123456",
+        "position": 3,
+        "topic": "talk about anything",
+        "nsfw": False,
+        "rate_limit_per_user": 0,
+        "permissions": "2248473465835073",
+        "last_message_id": "1199234567890123456",
+    },
+    "member": {
+        "user": USER,
+        "roles": ["1031234567890123456", "1031234567890123457"],
+        "joined_at": "2023-03-01T12:00:00.000000+00:00",
+        "nick": None,
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+        "pending": False,
+        "permissions": "2248473465835073",
+    },
+    "app_permissions": "2248473465835073",
+    "locale": "en-US",
+    "guild_locale": "en-US",
+    "entitlements": [],
+    "authorizing_integration_owners": {"0": "1001234567890123456"},
+    "context": 0,
+    "data": {
+        "id": "1111234567890123456",
+        "name": "profile",
+        "type": 1,
+        "guild_id": "1001234567890123456",
+        "options": [
+            {"name": "user", "type": 6, "value": "1051234567890123456"},
+            {"name": "public", "type": 5, "value": True},
+        ],
+        "resolved": {
+            "users": {"1051234567890123456": {**USER, "id": "1051234567890123456"}},
+            "members": {
+                "1051234567890123456": {
+                    "roles": ["1031234567890123456"],
+                    "joined_at": "2022-11-11T08:30:00.000000+00:00",
+                    "nick": "nick",
+                    "flags": 0,
+                    "pending": False,
+                    "permissions": "2248473465835073",
+                }
+            },
+        },
+    },
+}
+
+MESSAGE = {
+    "type": 4,
+    "data": {
+        "content": "Here is the profile you asked for.",
+        "embeds": [
+            {
+                "title": "Someone",
+                "description": "A member since 2022. " * 10,
+                "color": 5793266,
+                "thumbnail": {"url": "https://cdn.discordapp.com/avatars/1/a.png"},
+                "fields": [
+                    {"name": f"field {i}", "value": "value " * 8, "inline": True}
+                    for i in range(6)
+                ],
+                "footer": {"text": "discohook"},
+            }
+        ],
+        "components": [
+            {
+                "type": 1,
+                "components": [
+                    {
+                        "type": 2,
+                        "style": 1,
+                        "label": f"button {i}",
+                        "custom_id": f"profile:1051234567890123456:{i}",
+                    }
+                    for i in range(5)
+                ],
+            }
+        ],
+        "allowed_mentions": {"parse": []},
+        "flags": 64,
+    },
+}
+
+
+def main(number: int = 20000):
+    codecs = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codecs.append(JSONCodec.from_name(name))
+        except ImportError:
+            print(f"{name:8} not installed")
+    body = JSONCodec.from_name("json").dumps(INTERACTION)
+    baseline = {}
+    for codec in codecs:
+        decode = timeit.timeit(lambda: codec.loads(body), number=number) / number
+        encode = timeit.timeit(lambda: codec.dumps(MESSAGE), number=number) / number
+        baseline.setdefault("decode", decode)
+        baseline.setdefault("encode", encode)
+        print(
+            f"{codec.name:8} decode interaction {decode * 1e6:6.2f}us"
+            f" ({baseline['decode'] / decode:4.1f}x)"
+            f"  encode message {encode * 1e6:6.2f}us"
+            f" ({baseline['encode'] / encode:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
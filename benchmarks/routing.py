@@ -0,0 +1,104 @@
+"""
+Compares dispatching an application command interaction to its callback through the command
+registry, as the handler did before routes were precompiled, with the precompiled routing table.
+Both paths look the callback up, bind the options to its parameters and call it, the table
+also running the checks and error handling every command goes through.
+
+    python -m benchmarks.routing
+"""
+
+import timeit
+
+import discohook
+from discohook.command import ApplicationCommandOptionType
+from discohook.handler import _route_key
+from discohook.resolver import build_slash_command_params
+
+
+class Interaction:
+    # the fields of an interaction the dispatch reads
+    def __init__(self, payload):
+        self.payload = payload
+        self.data = payload["data"]
+        self.guild_id = None
+        self._auto_deferred = None
+
+
+async def callback(_, value: int = 0, *, text: str = ""):
+    pass
+
+
+def make_client(commands: int) -> discohook.Client:
+    client = discohook.Client(
+        application_id="1101234567890123456", public_key="00" * 32, token="token"
+    )
+    for i in range(commands):
+        command = discohook.command.slash(f"command{i}", description="d")(callback)
+        for j in range(3):
+            command.subcommand(f"sub{j}", "d")(callback)
+        client.load(command)
+    return client
+
+
+def interaction(name: str, subcommand: str) -> Interaction:
+    options = [
+        {"type": ApplicationCommandOptionType.integer, "name": "value", "value": 3},
+        {"type": ApplicationCommandOptionType.string, "name": "text", "value": "hi"},
+    ]
+    return Interaction(
+        {
+            "type": 2,
+            "data": {
+                "id": "1111234567890123456",
+                "name": name,
+                "type": 1,
+                "options": [{"type": 1, "name": subcommand, "options": options}],
+            },
+        }
+    )
+
+
+def run(coro):
+    # the callbacks never suspend, so no event loop is needed to run them
+    try:
+        coro.send(None)
+    except StopIteration:
+        pass
+
+
+def registry_dispatch(client: discohook.Client, inter: Interaction):
+    data = inter.data
+    guild_id = data.get("guild_id")
+    if guild_id:
+        key = f"{data['name']}:{guild_id}:{data['type']}"
+    else:
+        key = f"{data['name']}:{data['type']}"
+    target = client.commands[key]
+    options = data.get("options")
+    if options and options[0]["type"] == ApplicationCommandOptionType.subcommand:
+        target = target.subcommands[options[0]["name"]]
+    args, kwargs = build_slash_command_params(target.callback, inter)
+    run(target(inter, *args, **kwargs))
+
+
+def table_dispatch(client: discohook.Client, inter: Interaction):
+    # noinspection PyProtectedMember
+    run(client._routes[_route_key(inter)](inter))
+
+
+def main(number: int = 100000):
+    for commands in (10, 300):
+        client = make_client(commands)
+        inter = interaction(f"command{commands // 2}", "sub1")
+        registry = timeit.timeit(
+            lambda: registry_dispatch(client, inter), number=number
+        )
+        table = timeit.timeit(lambda: table_dispatch(client, inter), number=number)
+        print(
+            f"{commands:4} commands  registry {registry / number * 1e6:5.2f}us"
+            f"  table {table / number * 1e6:5.2f}us ({registry / table:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,15 +17,21 @@ __version__ = "0.0.7a"
 
 from .adapter import FollowupResponse, InteractionResponse
 from .attachment import Attachment
+from .broadcast import BroadcastResult
 from .button import Button
+from .cache import ResponseCache
 from .channel import Channel, PartialChannel
 from .client import Client
+from .coalesce import EditCoalescer
+from .codec import JSONCodec
 from .command import ApplicationCommand, SubCommand
 from .embed import Embed
 from .emoji import PartialEmoji
 from .enums import *
 from .file import File
 from .guild import Guild, PartialGuild
+from .health import AdaptiveLimit, CircuitBreaker
+from .https import HTTPResponse
 from .interaction import Interaction
 from .member import Member
 from .message import Message
@@ -34,8 +40,11 @@ from .models import AllowedMentions, MessageReference
 from .option import Choice, Option
 from .permission import Permission
 from .poll import Poll, PollAnswer, PollLayoutType, PollMedia, PollAnswerCount
+from .retry import RetryPolicy
 from .role import PartialRole, Role
+from .scheduler import Priority, Scheduler, priority
 from .select import Select, SelectOption
+from .store import EntityStore
 from .user import User
 from .view import View
 from .webhook import PartialWebhook, Webhook
@@ -1,3 +1,4 @@
+import asyncio
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from .embed import Embed
@@ -43,13 +44,19 @@ class InteractionResponse:
         file: Optional[File] = MISSING,
         files: Optional[List[File]] = MISSING,
         suppress_embeds: Optional[bool] = MISSING,
+        allowed_mentions: Optional[AllowedMentions] = MISSING,
+        poll: Optional[Poll] = MISSING,
     ) -> Message:
         """
         Edits the response message.
 
         Parameters
         ----------
-        same as :meth:`Message.edit`
+        same as :meth:`Message.edit`, and
+        allowed_mentions: Optional[AllowedMentions]
+            The allowed mentions of the message.
+        poll: Optional[Poll]
+            The poll of the message, only when it completes a deferred response.
         """
         payload = _EditingPayload(
             content=content,
@@ -60,6 +67,8 @@ class InteractionResponse:
             file=file,
             files=files,
             suppress_embeds=suppress_embeds,
+            allowed_mentions=allowed_mentions,
+            poll=poll,
         )
         if view and view is not MISSING:
             self.inter.client.load_view(view)
@@ -67,7 +76,7 @@ class InteractionResponse:
             self.inter.application_id,
             self.inter.token,
             "@original",
-            payload.to_form(),
+            payload.to_body(),
         )
         data = await resp.json()
         return Message(self.inter.client, data)
@@ -127,7 +136,7 @@ class FollowupResponse:
             self.interaction.application_id,
             self.interaction.token,
             self.message.id,
-            payload.to_form(),
+            payload.to_body(),
         )
         data = await resp.json()
         return Message(self.interaction.client, data)
@@ -141,6 +150,37 @@ class ResponseAdapter:
     def __init__(self, interaction: "Interaction") -> None:
         self.inter = interaction
 
+    async def _callback(
+        self,
+        payload: Dict[str, Any],
+        *,
+        files: Optional[List[File]] = None,
+    ):
+        # marked before any await so the auto defer watchdog can not respond twice
+        self.inter._responded = True
+        inline = self.inter._inline
+        if inline is not None and not inline.done() and not files:
+            inline.set_result(payload)
+            try:
+                await asyncio.wait_for(self.inter._inline_sent.wait(), timeout=3)
+            except asyncio.TimeoutError:
+                pass
+            return
+        try:
+            # multipart framing is only paid for when there are files to upload
+            if files:
+                form = _SendingPayload._create_form(payload, files)
+                await self.inter.client.http.send_interaction_mp_callback(
+                    self.inter.id, self.inter.token, form
+                )
+            else:
+                await self.inter.client.http.send_interaction_callback(
+                    self.inter.id, self.inter.token, payload
+                )
+        except Exception:
+            self.inter._responded = False
+            raise
+
     async def send(
         self,
         content: Optional[str] = None,
@@ -155,10 +195,15 @@ class ResponseAdapter:
         ephemeral: Optional[bool] = False,
         suppress_embeds: Optional[bool] = False,
         poll: Optional[Poll] = None,
-    ) -> InteractionResponse:
+    ) -> Union[InteractionResponse, FollowupResponse]:
         """
         Sends a response to the interaction
 
+        If the interaction was deferred automatically, this edits the deferred response
+        of application commands and sends a followup message for components.
+        If ``ephemeral`` differs from the automatic defer, the deferred response is deleted
+        and a followup message is sent instead, so an ephemeral response is never made public.
+
         Parameters
         ----------
         content: Optional[str]
@@ -186,8 +231,43 @@ class ResponseAdapter:
 
         Returns
         -------
-        InteractionResponse
+        InteractionResponse | FollowupResponse
         """
+        if self.inter._auto_deferred:
+            await self.inter._auto_deferred
+            mismatch = bool(ephemeral) != self.inter._deferred_ephemeral
+            if self.inter.type == InteractionType.app_command and mismatch:
+                # the first followup would otherwise take over the deferred response,
+                # and its visibility with it
+                await InteractionResponse(self.inter).delete()
+            if self.inter.type != InteractionType.app_command or mismatch:
+                return await self.followup(
+                    content,
+                    embed=embed,
+                    embeds=embeds,
+                    view=view,
+                    tts=tts,
+                    file=file,
+                    files=files,
+                    allowed_mentions=allowed_mentions,
+                    ephemeral=ephemeral,
+                    suppress_embeds=suppress_embeds,
+                    poll=poll,
+                )
+            response = InteractionResponse(self.inter)
+            await response.edit(
+                content if content is not None else MISSING,
+                embed=embed or MISSING,
+                embeds=embeds or MISSING,
+                view=view or MISSING,
+                tts=tts or MISSING,
+                file=file or MISSING,
+                files=files or MISSING,
+                suppress_embeds=suppress_embeds or MISSING,
+                allowed_mentions=allowed_mentions or MISSING,
+                poll=poll or MISSING,
+            )
+            return response
         payload = _SendingPayload(
             content=content,
             embed=embed,
@@ -203,9 +283,9 @@ class ResponseAdapter:
         )
         if view:
             self.inter.client.load_view(view)
-        payload = payload.to_form(InteractionCallbackType.channel_message_with_source)
-        await self.inter.client.http.send_interaction_mp_callback(
-            self.inter.id, self.inter.token, payload
+        await self._callback(
+            payload.to_dict(InteractionCallbackType.channel_message_with_source),
+            files=payload.files,
         )
         self.inter._responded = True
         return InteractionResponse(self.inter)
@@ -228,14 +308,12 @@ class ResponseAdapter:
             InteractionType.app_command,
         ):
             raise InteractionTypeMismatch(f"Method not supported for {self.inter.type}")
-        self.inter.client.active_components[modal.custom_id] = modal
+        self.inter.client.active_components.add(modal)
         payload = {
             "data": modal.to_dict(),
             "type": InteractionCallbackType.modal,
         }
-        await self.inter.client.http.send_interaction_callback(
-            self.inter.id, self.inter.token, payload
-        )
+        await self._callback(payload)
         self.inter._responded = True
         return InteractionResponse(self.inter)
 
@@ -255,9 +333,7 @@ class ResponseAdapter:
             "type": InteractionCallbackType.autocomplete,
             "data": {"choices": [i.to_dict() for i in choices]},
         }
-        await self.inter.client.http.send_interaction_callback(
-            self.inter.id, self.inter.token, payload
-        )
+        await self._callback(payload)
 
     async def defer(
         self, ephemeral: bool = False, thinking: bool = False
@@ -275,6 +351,10 @@ class ResponseAdapter:
             (DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE) or do nothing to edit the original message later
             (DEFERRED_UPDATE_MESSAGE). Not available for application commands.
         """
+        deferred = self.inter._auto_deferred
+        if deferred and deferred is not asyncio.current_task():
+            await deferred
+            return InteractionResponse(self.inter)
         payload = {}
         if (
             self.inter.type is InteractionType.component
@@ -299,10 +379,9 @@ class ResponseAdapter:
         else:
             raise InteractionTypeMismatch(f"Method not supported for {self.inter.type}")
 
-        await self.inter.client.http.send_interaction_callback(
-            self.inter.id, self.inter.token, payload
-        )
+        await self._callback(payload)
         self.inter._responded = True
+        self.inter._deferred_ephemeral = "data" in payload
         return InteractionResponse(self.inter)
 
     async def require_premium(self):
@@ -316,9 +395,7 @@ class ResponseAdapter:
             "data": {},
             "type": InteractionCallbackType.premium_required,
         }
-        await self.inter.client.http.send_interaction_callback(
-            self.inter.id, self.inter.token, payload
-        )
+        await self._callback(payload)
         self.inter._responded = True
         return InteractionResponse(self.inter)
 
@@ -367,6 +444,20 @@ class ResponseAdapter:
         ):
             raise InteractionTypeMismatch(f"Method not supported for {self.inter.type}")
 
+        if self.inter._auto_deferred:
+            await self.inter._auto_deferred
+            response = InteractionResponse(self.inter)
+            await response.edit(
+                content,
+                embed=embed,
+                embeds=embeds,
+                view=view,
+                tts=tts,
+                file=file,
+                files=files,
+                suppress_embeds=suppress_embeds,
+            )
+            return response
         payload = _EditingPayload(
             content=content,
             embed=embed,
@@ -379,9 +470,9 @@ class ResponseAdapter:
         )
         if view and view is not MISSING:
             self.inter.client.load_view(view)
-        payload = payload.to_form(InteractionCallbackType.update_component_message)
-        await self.inter.client.http.send_interaction_mp_callback(
-            self.inter.id, self.inter.token, payload
+        await self._callback(
+            payload.to_dict(InteractionCallbackType.update_component_message),
+            files=payload.files,
         )
         self.inter._responded = True
         return InteractionResponse(self.inter)
@@ -445,7 +536,7 @@ class ResponseAdapter:
         if view:
             self.inter.client.load_view(view)
         resp = await self.inter.client.http.send_webhook_message(
-            self.inter.application_id, self.inter.token, payload.to_form()
+            self.inter.application_id, self.inter.token, payload.to_body()
         )
         data = await resp.json()
         return FollowupResponse(data, self.inter)
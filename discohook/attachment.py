@@ -1,10 +1,26 @@
-from typing import Optional
+import asyncio
+import os
+from typing import IO, TYPE_CHECKING, AsyncIterator, Optional, Union
 
-import aiohttp
+from .errors import AttachmentTooLarge, HTTPException
+
+if TYPE_CHECKING:
+    from .client import Client
+
+#: The number of bytes read from the network at a time.
+CHUNK_SIZE = 64 * 1024
 
 
 class Attachment:
-    def __init__(self, data: dict) -> None:
+    """
+    Represents an attachment of a message or an attachment option.
+
+    Downloads go through the pooled download session of the client, which keeps
+    connections apart from the ones requests to discord use.
+    """
+
+    def __init__(self, client: "Client", data: dict) -> None:
+        self.client = client
         self.id: str = data["id"]
         self.filename: str = data["filename"]
         self.description: Optional[str] = data.get("description")
@@ -18,13 +34,120 @@ class Attachment:
         self.duration_secs: Optional[int] = data.get("duration_secs")
         self.waveform: Optional[str] = data.get("waveform")
         self.flags: Optional[int] = data.get("flags")
+        self._prefetch: Optional[asyncio.Task] = None
+
+    def _check_size(self, size: int, max_size: Optional[int]):
+        if max_size is not None and size > max_size:
+            raise AttachmentTooLarge(
+                f"attachment `{self.filename}` is larger than {max_size} bytes"
+            )
+
+    async def iter(
+        self, chunk_size: int = CHUNK_SIZE, *, max_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Streams the content of the attachment in chunks.
+
+        Parameters
+        ----------
+        chunk_size: int
+            The maximum size of a chunk in bytes.
+        max_size: int | None
+            The size in bytes above which the download is refused.
+
+        Raises
+        ------
+        AttachmentTooLarge
+            If the attachment is larger than ``max_size``, checked before anything is downloaded.
+        HTTPException
+            If the attachment could not be downloaded.
+        """
+        self._check_size(self.size, max_size)
+        session = self.client.http.get_download_session()
+        async with session.get(self.url) as resp:
+            if resp.status >= 400:
+                raise HTTPException(resp, await resp.text())
+            received = 0
+            async for chunk in resp.content.iter_chunked(chunk_size):
+                # the reported size is only trusted until the body says otherwise
+                received += len(chunk)
+                self._check_size(received, max_size)
+                yield chunk
+
+    async def _read(self, max_size: Optional[int]) -> bytes:
+        return b"".join([chunk async for chunk in self.iter(max_size=max_size)])
+
+    async def read(self, *, max_size: Optional[int] = None) -> bytes:
+        """
+        Downloads the content of the attachment.
+
+        Parameters
+        ----------
+        max_size: int | None
+            The size in bytes above which the download is refused.
+
+        Raises
+        ------
+        AttachmentTooLarge
+            If the attachment is larger than ``max_size``.
+        HTTPException
+            If the attachment could not be downloaded.
+        """
+        self._check_size(self.size, max_size)
+        if self._prefetch:
+            return await asyncio.shield(self._prefetch)
+        return await self._read(max_size)
+
+    async def save(
+        self,
+        fp: Union[str, "os.PathLike[str]", IO[bytes]],
+        *,
+        chunk_size: int = CHUNK_SIZE,
+        max_size: Optional[int] = None,
+    ) -> int:
+        """
+        Downloads the attachment to a file, holding at most one chunk in memory.
+
+        Parameters
+        ----------
+        fp: str | os.PathLike | IO[bytes]
+            The path of the file to write, or a binary file object to write to.
+        chunk_size: int
+            The maximum size of a chunk in bytes.
+        max_size: int | None
+            The size in bytes above which the download is refused.
+
+        Returns
+        -------
+        int
+            The number of bytes written.
+        """
+        loop = asyncio.get_running_loop()
+        if isinstance(fp, (str, os.PathLike)):
+            self._check_size(self.size, max_size)
+            f = await loop.run_in_executor(None, open, fp, "wb")
+            try:
+                return await self.save(f, chunk_size=chunk_size, max_size=max_size)
+            finally:
+                await loop.run_in_executor(None, f.close)
+        written = 0
+        async for chunk in self.iter(chunk_size, max_size=max_size):
+            written += await loop.run_in_executor(None, fp.write, chunk)
+        return written
 
-    async def read(self) -> bytes:
-        async with aiohttp.ClientSession() as session:
-            resp = await session.get(self.url)
-            return await resp.content.read()
+    def prefetch(self, *, max_size: Optional[int] = None):
+        """
+        Starts downloading the attachment in the background, :meth:`read` returns the result.
 
-    async def iter(self) -> aiohttp.StreamReader:
-        async with aiohttp.ClientSession() as session:
-            resp = await session.get(self.url)
-            return resp.content
+        Parameters
+        ----------
+        max_size: int | None
+            The size in bytes above which the attachment is not prefetched.
+        """
+        if self._prefetch or (max_size is not None and self.size > max_size):
+            return
+        self._prefetch = asyncio.create_task(self._read(max_size))
+        # the download may never be read, its failure must not be reported as unretrieved
+        self._prefetch.add_done_callback(
+            lambda task: task.cancelled() or task.exception()
+        )
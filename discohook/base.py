@@ -1,8 +1,11 @@
 import asyncio
+import copy
 import secrets
 from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
 from .enums import ComponentType
+from .router import format_pattern
+from .state import StateCodec
 
 if TYPE_CHECKING:
     from .interaction import Interaction
@@ -13,6 +16,9 @@ class Interactable:
     def __init__(self):
         self.checks: List[Callable[["Interaction"], bool]] = []
         self._error_handler: Optional[Callable[["Interaction", Exception], Any]] = None
+        self.auto_defer: Optional[float] = None
+        self.auto_defer_ephemeral: bool = False
+        self.background: bool = False
 
     def check(self):
         """
@@ -49,15 +55,38 @@ class Component(Interactable):
     ----------
     type: :class:`ComponentType`
         The type of the component.
+    custom_id: str | None
+        The custom id of the component. Generated randomly if not provided.
+    auto_defer: float | None
+        Seconds after the interaction was created at which it is deferred automatically
+        if the callback has not responded yet.
+    background: bool
+        Whether to acknowledge the interaction immediately and run the callback
+        on the client's worker pool.
+    timeout: float | None
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
     """
 
     def __init__(
-        self, type: Optional[ComponentType] = None, custom_id: Optional[str] = None
+        self,
+        type: Optional[ComponentType] = None,
+        custom_id: Optional[str] = None,
+        *,
+        auto_defer: Optional[float] = None,
+        background: bool = False,
+        timeout: Optional[float] = None,
     ):
         super().__init__()
         self.type = type
+        self.auto_defer = auto_defer
+        self.background = background
+        self.timeout = timeout
         self.callback: Optional[Callable[["Interaction", Any], Any]] = None
         self.custom_id = custom_id or secrets.token_urlsafe(8)
+        self.pattern: Optional[str] = None
+        self.state: Optional[str] = None
+        self._codec: Optional[StateCodec] = None
 
     def on_interaction(self):
         """
@@ -76,6 +105,35 @@ class Component(Interactable):
 
         return decorator
 
+    def bind(self, *state: Any, **values: Any):
+        """
+        Returns a copy of a component preloaded with a custom id pattern or a state format,
+        with the fields of the pattern or the state packed into its custom id.
+
+        Parameters
+        ----------
+        *state: Any
+            The values of the state, in the order of the state format.
+        **values: Any
+            The values of the fields of the pattern.
+
+        Raises
+        ------
+        ValueError
+            If the component was preloaded with neither, a field has no value
+            or the state does not match the format.
+        """
+        component = copy.copy(self)
+        if self._codec:
+            component.custom_id = self._codec.encode(state)
+        elif self.pattern:
+            component.custom_id = format_pattern(self.pattern, values)
+        else:
+            raise ValueError(
+                "component was not preloaded with a custom id pattern or state format"
+            )
+        return component
+
     def __call__(self, *args, **kwargs):
         if not self.callback:
             raise RuntimeWarning("No callback registered for this component.")
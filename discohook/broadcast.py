@@ -0,0 +1,149 @@
+import asyncio
+from collections import OrderedDict, deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .channel import PartialChannel
+from .message import Message
+from .scheduler import Priority, priority
+from .webhook import PartialWebhook
+
+if TYPE_CHECKING:
+    from .client import Client
+
+#: A channel id, a channel or a webhook a message is broadcast to.
+Target = Union[str, PartialChannel, PartialWebhook]
+
+
+class BroadcastResult:
+    """
+    The outcome of sending a broadcast message to one target.
+
+    Attributes
+    ----------
+    target: str | PartialChannel | PartialWebhook
+        The target as it was given.
+    message: Message | None
+        The message that was sent, None if sending failed.
+    error: Exception | None
+        Why sending failed, None if it succeeded.
+    """
+
+    __slots__ = ("target", "message", "error")
+
+    def __init__(
+        self,
+        target: Target,
+        message: Optional[Message] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.target = target
+        self.message = message
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = (
+            f"error={self.error!r}" if self.error else f"message={self.message.id}"
+        )
+        return f"<BroadcastResult target={_key(self.target)} {outcome}>"
+
+
+def _key(target: Target) -> Tuple[str, ...]:
+    # the major parameter the rate limit buckets of the target are keyed by
+    if isinstance(target, PartialWebhook):
+        return "webhooks", target.id, target.token
+    if isinstance(target, PartialChannel):
+        return "channels", target.id
+    return "channels", target
+
+
+def _interleave(targets: Iterable[Target]) -> List[Target]:
+    # targets sharing a bucket are spread out so a worker never waits on a bucket
+    # another target could use in the meantime
+    groups: Dict[Tuple[str, ...], "deque[Target]"] = OrderedDict()
+    for target in targets:
+        groups.setdefault(_key(target), deque()).append(target)
+    ordered = []
+    while groups:
+        for key in list(groups):
+            ordered.append(groups[key].popleft())
+            if not groups[key]:
+                del groups[key]
+    return ordered
+
+
+async def _send(client: "Client", target: Target, body: bytes) -> Message:
+    if isinstance(target, PartialWebhook):
+        resp = await client.http.execute_webhook(
+            target.id, target.token, body, params={"wait": 1}
+        )
+    else:
+        channel_id = target.id if isinstance(target, PartialChannel) else target
+        resp = await client.http.send_message(channel_id, body)
+    return Message(client, await resp.json())
+
+
+async def broadcast(
+    client: "Client",
+    targets: Iterable[Target],
+    payload: Dict[str, Any],
+    *,
+    concurrency: int = 16,
+) -> AsyncIterator[BroadcastResult]:
+    """
+    Sends one payload to many targets and yields the result of every target as it completes.
+
+    The payload is encoded once. Requests run at :attr:`Priority.bulk` so interaction traffic
+    stays ahead of them, and are paced by the rate limiter, the global limit of 50 requests
+    per second being what bounds the throughput to channels.
+    Closing the iterator early cancels the sends that have not completed.
+
+    Parameters
+    ----------
+    client: Client
+        The client to send with.
+    targets: Iterable[str | PartialChannel | PartialWebhook]
+        The channels, by id or object, and webhooks to send to.
+    payload: Dict[str, Any]
+        The JSON payload of the message.
+    concurrency: int
+        The number of sends in flight. Defaults to 16, the bulk share of the scheduler.
+    """
+    body = client.codec.dumps(payload)
+    pending = _interleave(targets)
+    pending.reverse()
+    results: "asyncio.Queue[BroadcastResult]" = asyncio.Queue()
+
+    async def work():
+        while pending:
+            target = pending.pop()
+            try:
+                result = BroadcastResult(target, await _send(client, target, body))
+            except Exception as e:
+                result = BroadcastResult(target, error=e)
+            results.put_nowait(result)
+
+    total = len(pending)
+    with priority(Priority.bulk):
+        # the tasks inherit the priority from the context they are created in
+        workers = [asyncio.create_task(work()) for _ in range(min(concurrency, total))]
+    try:
+        for _ in range(total):
+            yield await results.get()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -25,6 +25,13 @@ class Button(Component):
         Whether the button is disabled or not.
     emoji: :class:`str` | :class:`PartialEmoji` | None
         The emoji to be displayed on the button.
+    auto_defer: float | None
+        Seconds after the interaction was created at which it is deferred automatically.
+    background: :class:`bool`
+        Whether to acknowledge the interaction immediately and run the callback in the background.
+    timeout: float | None
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
     """
 
     def __init__(
@@ -36,8 +43,17 @@ class Button(Component):
         disabled: bool = False,
         emoji: Optional[Union[str, PartialEmoji]] = None,
         custom_id: Optional[str] = None,
+        auto_defer: Optional[float] = None,
+        background: bool = False,
+        timeout: Optional[float] = None,
     ):
-        super().__init__(ComponentType.button, custom_id)
+        super().__init__(
+            ComponentType.button,
+            custom_id,
+            auto_defer=auto_defer,
+            background=background,
+            timeout=timeout,
+        )
         self.url = url
         self.label = label
         self.style = style
@@ -79,6 +95,9 @@ def new(
     disabled: bool = False,
     emoji: Optional[Union[str, PartialEmoji]] = None,
     custom_id: Optional[str] = None,
+    auto_defer: Optional[float] = None,
+    background: bool = False,
+    timeout: Optional[float] = None,
 ):
     """
     A decorator that creates a button and registers a callback.
@@ -95,6 +114,13 @@ def new(
         The emoji to be displayed on the button.
     custom_id: Optional[:class:`str`]
         The custom id of the button.
+    auto_defer: Optional[:class:`float`]
+        Seconds after the interaction was created at which it is deferred automatically.
+    background: :class:`bool`
+        Whether to acknowledge the interaction immediately and run the callback in the background.
+    timeout: Optional[:class:`float`]
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
     """
 
     def decorator(coro: Callable[["Interaction"], Any]):
@@ -106,6 +132,9 @@ def new(
             disabled=disabled,
             emoji=emoji,
             custom_id=custom_id,
+            auto_defer=auto_defer,
+            background=background,
+            timeout=timeout,
         )
         self.callback = coro
         return self
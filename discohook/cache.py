@@ -0,0 +1,320 @@
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .ratelimit import parse_route
+
+if TYPE_CHECKING:
+    from .base import Component
+    # only named in the generic base of ResponseCache, which flake8 does not read
+    from .https import HTTPResponse  # noqa: F401
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    A mapping with least recently used eviction and per entry expiry.
+
+    Parameters
+    ----------
+    max_size: int | None
+        The maximum number of unpinned entries. The least recently used entry is evicted
+        when it is exceeded. Unbounded if not provided.
+    ttl: float | None
+        The default number of seconds an entry lives for. Entries never expire if not provided.
+    sliding: bool
+        Whether a hit extends the lifetime of the entry by its ttl again.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        *,
+        sliding: bool = False,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.sliding = sliding
+        # key -> (value, expires at, ttl)
+        self._data: "OrderedDict[K, Tuple[V, Optional[float], Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._pinned: Dict[K, V] = {}
+        self._next_purge = 64
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Returns the value of a key and marks it as recently used.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key to look up.
+        default: Any
+            The value returned if the key is missing or expired.
+        """
+        if key in self._pinned:
+            self._hits += 1
+            return self._pinned[key]
+        entry = self._data.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+        value, expires_at, ttl = entry
+        if expires_at is not None:
+            now = time.monotonic()
+            if expires_at <= now:
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return default
+            if self.sliding:
+                self._data[key] = (value, now + ttl, ttl)
+        self._data.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V, *, ttl: Optional[float] = None):
+        """
+        Stores a value, evicting the least recently used entries if the cache is full.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key to store the value under.
+        value: Any
+            The value to store.
+        ttl: float | None
+            Seconds the entry lives for. Defaults to the ttl of the cache.
+            A pinned key keeps its pin and only has its value replaced.
+        """
+        if key in self._pinned:
+            self._pinned[key] = value
+            return
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._data[key] = (value, expires_at, ttl)
+        self._data.move_to_end(key)
+        if len(self._data) >= self._next_purge:
+            # amortised sweep so entries that are never looked up again do not pile up
+            self.purge()
+            self._next_purge = max(64, len(self._data) * 2)
+        if self.max_size is not None:
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def pin(self, key: K, value: V):
+        """
+        Stores a value that never expires and is never evicted.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key to store the value under.
+        value: Any
+            The value to store.
+        """
+        self._data.pop(key, None)
+        self._pinned[key] = value
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Removes a key and returns its value, pinned or not.
+        """
+        if key in self._pinned:
+            return self._pinned.pop(key)
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+        return entry[0]
+
+    def purge(self) -> int:
+        """
+        Removes every expired entry.
+
+        Returns
+        -------
+        int
+            The number of entries removed.
+        """
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (_, expires_at, _) in self._data.items()
+            if expires_at is not None and expires_at <= now
+        ]
+        for key in expired:
+            del self._data[key]
+        self._expirations += len(expired)
+        return len(expired)
+
+    def clear(self):
+        """
+        Removes every unpinned entry.
+        """
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the size and hit rate of the cache.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return {
+            "size": len(self),
+            "pinned": len(self._pinned),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+    def __contains__(self, key: K) -> bool:
+        if key in self._pinned:
+            return True
+        entry = self._data.get(key)
+        return entry is not None and (entry[1] is None or entry[1] > time.monotonic())
+
+    def __getitem__(self, key: K) -> V:
+        if key not in self:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __setitem__(self, key: K, value: V):
+        self.set(key, value)
+
+    def __delitem__(self, key: K):
+        if key in self._pinned:
+            del self._pinned[key]
+        else:
+            del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data) + len(self._pinned)
+
+    def __iter__(self) -> Iterator[K]:
+        yield from list(self._pinned)
+        yield from list(self._data)
+
+
+class ComponentRegistry(TTLCache[str, "Component"]):
+    """
+    The registry of components the client can dispatch interactions to, keyed by custom id.
+
+    Components expire after ``ttl`` seconds without being interacted with,
+    unless they set a timeout of their own. Persistent components are pinned.
+
+    Parameters
+    ----------
+    max_size: int | None
+        The maximum number of components kept alive. Unbounded if not provided.
+    ttl: float | None
+        Seconds of inactivity after which a component is dropped. Never if not provided.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl: Optional[float] = None):
+        super().__init__(max_size, ttl, sliding=True)
+
+    def add(self, component: "Component"):
+        """
+        Registers a component under its custom id using its own timeout if it has one.
+
+        Parameters
+        ----------
+        component: Component
+            The component to register.
+        """
+        self.set(component.custom_id, component, ttl=component.timeout)
+
+
+#: Seconds the responses of read endpoints are cached for, keyed by route template.
+DEFAULT_TTLS: Dict[str, float] = {
+    "/channels/{id}": 60,
+    "/guilds/{id}": 60,
+    "/guilds/{id}/channels": 60,
+    "/guilds/{id}/roles": 60,
+    "/guilds/{id}/members/{id}": 60,
+    "/users/{id}": 300,
+}
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...], bool]
+
+
+class ResponseCache(TTLCache[CacheKey, "HTTPResponse"]):
+    """
+    Caches the responses of read endpoints of discord.
+
+    Entries are invalidated when a request changing the same resource succeeds:
+    a write to a path drops the cached responses of the path, of its parents and of its children,
+    and a write to a channel also drops every cached channel list of guilds.
+
+    Parameters
+    ----------
+    ttls: Dict[str, float] | None
+        Seconds the responses of a route template such as ``/guilds/{id}/roles`` are cached for.
+        Routes not listed are never cached. Defaults to :data:`DEFAULT_TTLS`.
+    max_size: int
+        The maximum number of cached responses. Defaults to 1000.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_size: int = 1000):
+        super().__init__(max_size)
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        # bumped on every write, a read that started before a write must not be cached
+        self.generation = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """
+        Returns the seconds the response of a path is cached for, None if it is not cached.
+        """
+        return self.ttls.get(parse_route("GET", path)[0][1])
+
+    def invalidate(self, path: str) -> int:
+        """
+        Drops the cached responses a successful write to the path may have changed.
+
+        Returns
+        -------
+        int
+            The number of responses dropped.
+        """
+        self.generation += 1
+        path = path.split("?", 1)[0]
+        channel = parse_route("PATCH", path)[0][1] == "/channels/{id}"
+        stale = []
+        for key in self:
+            cached = key[0].split("?", 1)[0]
+            if (
+                cached == path
+                or path.startswith(cached + "/")
+                or cached.startswith(path + "/")
+                or (
+                    channel
+                    and parse_route("GET", cached)[0][1] == "/guilds/{id}/channels"
+                )
+            ):
+                stale.append(key)
+        for key in stale:
+            self.pop(key)
+        return len(stale)
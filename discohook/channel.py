@@ -1,11 +1,10 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import aiohttp
-
 from .embed import Embed
 from .emoji import PartialEmoji
 from .enums import ChannelType
 from .file import File
+from .https import HTTPResponse
 from .message import Message
 from .models import AllowedMentions, MessageReference
 from .params import _SendingPayload
@@ -107,7 +106,7 @@ class PartialChannel:
             message_reference=message_reference,
         )
 
-        resp = await self.client.http.send_message(self.id, payload.to_form())
+        resp = await self.client.http.send_message(self.id, payload.to_body())
         data = await resp.json()
         return Message(self.client, data)
 
@@ -491,7 +490,7 @@ class Channel(PartialChannel):
         self.default_forum_layout = data.get("default_forum_layout")
 
     @classmethod
-    async def from_response(cls, client: "Client", response: aiohttp.ClientResponse):
+    async def from_response(cls, client: "Client", response: HTTPResponse):
         return cls(client, await response.json())
 
     @classmethod
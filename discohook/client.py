@@ -1,23 +1,50 @@
 import asyncio
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
-
-import aiohttp
+import contextlib
+import inspect
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
 
 from .base import Component
+from . import codec
+from .broadcast import BroadcastResult, Target, broadcast
+from .cache import ComponentRegistry, ResponseCache
 from .channel import Channel, PartialChannel
+from .coalesce import EditCoalescer
+from .codec import JSONCodec, JSONResponse
 from .command import ApplicationCommand
 from .dash import dashboard
 from .embed import Embed
 from .file import File
 from .guild import Guild
-from .handler import _handler
+from .handler import Invoker, RouteKey, _handler, compile_routes
+from .health import AdaptiveLimit, CircuitBreaker
 from .help import _help
-from .https import HTTPClient
+from .https import HTTPClient, HTTPResponse
 from .interaction import Interaction
 from .message import Message
+from .models import AllowedMentions
+from .pool import WorkerPool
+from .retry import RetryPolicy
+from .router import ComponentRouter, is_pattern
+from .scheduler import Scheduler
+from .state import StateCodec
+from .store import EntityStore
+from .params import _SendingPayload
 from .poll import Poll
 from .user import User
 from .utils import compare_password
@@ -30,7 +57,7 @@ async def delete_cmd(request: Request):
         return JSONResponse(
             {"error": "Password not set inside the application"}, status_code=500
         )
-    data = await request.json()
+    data = request.app.codec.loads(await request.body())
     password = data.get("password")
     command_id = data.get("id")
     guild_id = data.get("guild_id")
@@ -47,7 +74,7 @@ async def sync(request: Request):
         return JSONResponse(
             {"error": "Password not set inside the application"}, status_code=500
         )
-    data = await request.json()
+    data = request.app.codec.loads(await request.body())
     password = data.get("password")
     if not compare_password(request.app.password, password):
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
@@ -70,13 +97,46 @@ async def authenticate(request: Request):
         return JSONResponse(
             {"error": "Password not set inside the application"}, status_code=500
         )
-    data = await request.json()
+    data = request.app.codec.loads(await request.body())
     password = data.get("password")
     if not compare_password(request.app.password, password):
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
     return JSONResponse({"success": True}, status_code=200)
 
 
+def _lifespan(app_lifespan: Optional[Callable[[Any], Any]]):
+    """
+    Wraps the lifespan of the application to open the HTTP session at startup
+    and close it at shutdown.
+
+    The lifespan may be an async context manager factory or, as starlette also accepts,
+    an async generator function.
+    """
+    if inspect.isasyncgenfunction(app_lifespan):
+        app_lifespan = contextlib.asynccontextmanager(app_lifespan)
+    elif inspect.isgeneratorfunction(app_lifespan):
+        raise TypeError(
+            "lifespan must be an async context manager factory or an async generator function"
+        )
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: "Client"):
+        await app.http.start()
+        try:
+            if app_lifespan:
+                async with app_lifespan(app) as state:
+                    yield state
+            else:
+                yield
+        finally:
+            # background callbacks were already acknowledged, they finish before
+            # the session they talk to discord through is closed
+            await app.workers.close()
+            await app.http.close()
+
+    return lifespan
+
+
 class Client(Starlette):
     """
     The base client class for discohook.
@@ -95,6 +155,69 @@ class Client(Starlette):
         The password to use for the dashboard.
     default_help_command: bool
         Whether to use the default help command or not. Defaults to False.
+    inline_responses: bool
+        Whether to return the first interaction response as the body of the webhook request
+        instead of posting it to the callback endpoint. Defaults to False.
+    inline_response_timeout: float
+        Seconds to wait for an inline response before falling back to the callback endpoint.
+        Defaults to 2.5 seconds.
+    background_workers: int
+        The number of callbacks of background commands and components that may run at once.
+        Defaults to 16.
+    background_queue_size: int
+        The number of background callbacks that may wait for a free worker before new
+        interactions are rejected with :class:`WorkerPoolFull`. Defaults to 256.
+    component_ttl: float | None
+        Seconds of inactivity after which a component is dropped from :attr:`active_components`,
+        unless the component sets a timeout of its own. Components never expire if not provided.
+    max_components: int | None
+        The maximum number of components kept in :attr:`active_components`.
+        The least recently used component is dropped beyond it. Unbounded if not provided.
+        Preloaded components are pinned and count towards neither limit.
+    component_secret: str | None
+        The key used to sign the state of stateless components. Defaults to the token,
+        set it to keep components working across token resets.
+    connector_options: Dict[str, Any] | None
+        Keyword arguments for the :class:`aiohttp.TCPConnector` used to talk to discord,
+        e.g. ``limit``, ``limit_per_host``, ``keepalive_timeout`` and ``ttl_dns_cache``.
+        The session is opened and a connection to discord is established when the application
+        starts, and both are closed when it shuts down.
+    retry_policy: RetryPolicy | None
+        Decides how requests to discord failing with a 5xx, a connection error or a timeout
+        are retried. Defaults to :class:`RetryPolicy` with its defaults.
+    response_cache: ResponseCache | None
+        Caches the responses of read endpoints such as ``fetch_guild`` and ``fetch_channel``,
+        invalidated when the client changes the same resource. Nothing is cached if not provided.
+    entity_store: EntityStore | None
+        Keeps the users, members, roles and channels received with interactions, so that
+        :meth:`fetch_user`, :meth:`fetch_channel` and :meth:`PartialGuild.fetch_member` can answer
+        without a request. Channels resolved from options are partial. Nothing is kept if not provided.
+    json_codec: JSONCodec | str | None
+        The codec that encodes and decodes every JSON payload, or the name of its backend
+        (``msgspec``, ``orjson`` or ``json``). Defaults to the codec of the process,
+        the fastest one installed unless another was set.
+        The client encodes and decodes its requests with it, and a codec given here also becomes
+        the codec of the process, which encodes the payloads built before they reach a client.
+    prefetch_attachment_size: int | None
+        Attachment options up to this size in bytes start downloading as soon as
+        the interaction arrives, see :meth:`Interaction.prefetch_attachments`.
+        Nothing is prefetched if not provided.
+    scheduler: Scheduler | None
+        Orders outbound requests so interaction callbacks go first, followups and webhook edits next,
+        then other REST requests and finally bulk work marked with :func:`priority`.
+        Defaults to :class:`Scheduler` with its defaults.
+    concurrency: AdaptiveLimit | None
+        Shrinks the requests in flight when discord rate limits, fails or slows down
+        and grows them back when it recovers. Defaults to :class:`AdaptiveLimit`
+        starting from the total of the scheduler.
+    circuit_breaker: CircuitBreaker | None
+        Fails requests fast, or holds them, while discord keeps failing.
+        Interaction callbacks bypass it. Defaults to :class:`CircuitBreaker` with its defaults.
+        The state of all three is available from :meth:`HTTPClient.stats`.
+    edit_coalescer: EditCoalescer | None
+        Merges frequent edits of the same message, such as progress updates, into one request
+        per interval. Pending edits are sent when the application shuts down.
+        Every edit is sent as it is made if not provided.
     **kwargs
         Keyword arguments to pass to the FastAPI instance.
     """
@@ -108,17 +231,62 @@ class Client(Starlette):
         route: str = "/interactions",
         password: Optional[str] = None,
         default_help_command: bool = False,
+        inline_responses: bool = False,
+        inline_response_timeout: float = 2.5,
+        background_workers: int = 16,
+        background_queue_size: int = 256,
+        component_ttl: Optional[float] = None,
+        max_components: Optional[int] = None,
+        component_secret: Optional[str] = None,
+        connector_options: Optional[Dict[str, Any]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        entity_store: Optional[EntityStore] = None,
+        json_codec: Union[JSONCodec, str, None] = None,
+        prefetch_attachment_size: Optional[int] = None,
+        scheduler: Optional[Scheduler] = None,
+        concurrency: Optional[AdaptiveLimit] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        edit_coalescer: Optional[EditCoalescer] = None,
         **kwargs,
     ):
-        super().__init__(**kwargs)
+        super().__init__(lifespan=_lifespan(kwargs.pop("lifespan", None)), **kwargs)
         self.token = token
         self.public_key = public_key
+        # parsed on the first interaction, a client may be built before the key is known
+        self._verify_key: Optional[VerifyKey] = None
         self.application_id = application_id
         self.password = password
-        self.http = HTTPClient(self, token)
-        self.active_components: Dict[str, Component] = {}
+        self.inline_responses = inline_responses
+        self.inline_response_timeout = inline_response_timeout
+        self.codec = (
+            codec.get_codec() if json_codec is None else codec.set_codec(json_codec)
+        )
+        self.http = HTTPClient(
+            self,
+            token,
+            codec=self.codec,
+            connector_options=connector_options,
+            retry_policy=retry_policy,
+            cache=response_cache,
+            scheduler=scheduler,
+            concurrency=concurrency,
+            breaker=circuit_breaker,
+            edits=edit_coalescer,
+        )
+        self.entities = entity_store
+        self.prefetch_attachment_size = prefetch_attachment_size
+        self.workers = WorkerPool(background_workers, background_queue_size)
+        self.active_components = ComponentRegistry(max_components, component_ttl)
+        self.component_router = ComponentRouter()
+        self._component_secret = (component_secret or token).encode()
         self._sync_queue: List[ApplicationCommand] = []
         self.commands: Dict[str, ApplicationCommand] = {}
+        self._routes: Dict[RouteKey, Invoker] = {}
+        # the routes compiled from the command loaded under a key, and the listener
+        # recompiling them when handlers are attached to it
+        self._compiled: Dict[str, Dict[RouteKey, Invoker]] = {}
+        self._route_listeners: Dict[str, Callable[[], Any]] = {}
         self.add_route(route, _handler, methods=["POST"], include_in_schema=False)
         self.add_route("/api/sync", sync, methods=["POST"], include_in_schema=False)
         self.add_route("/api/dash", dashboard, methods=["GET"], include_in_schema=False)
@@ -135,6 +303,33 @@ class Client(Starlette):
             Callable[[Interaction, Exception], Any]
         ] = None
 
+    def _verify_request(self, signature: str, timestamp: str, body: bytes) -> bool:
+        """
+        Verifies the ed25519 signature of an incoming interaction request.
+
+        This method is used internally by the client. You should not use this method.
+        """
+        try:
+            signature = bytes.fromhex(signature)
+        except ValueError:
+            return False
+        if len(signature) != 64:
+            return False
+        # the verify key is built once and the signed message (signature + timestamp + body)
+        # is assembled in a single buffer, nacl would otherwise concatenate it again
+        if self._verify_key is None:
+            try:
+                self._verify_key = VerifyKey(bytes.fromhex(self.public_key))
+            except (TypeError, ValueError) as e:
+                raise ValueError(
+                    f"public key `{self.public_key}` is not a hex encoded ed25519 key"
+                ) from e
+        try:
+            self._verify_key.verify(b"".join((signature, timestamp.encode(), body)))
+        except BadSignatureError:
+            return False
+        return True
+
     def on_error(self):
         """
         A decorator to add an error handler for any server errors.
@@ -157,29 +352,54 @@ class Client(Starlette):
             The view to load components from.
         """
         for component in view.children:
-            self.active_components[component.custom_id] = component
+            # components bound from a pattern or a state are dispatched through the router
+            if component.pattern or component.state:
+                continue
+            self.active_components.add(component)
 
-    def preload(self, custom_id: str):
+    def preload(self, custom_id: str, *, state: Optional[str] = None):
         """
         This decorator is used to load a component into the client.
         This method will help you to use persistent components with static custom ids.
+        Preloaded components are pinned, they never expire and are never evicted.
+
+        The custom id can also be a pattern such as ``vote:{poll_id}:{choice:int}``.
+        Every matching custom id is then routed to the component, with the fields passed
+        to the callback as keyword arguments. Use :meth:`Component.bind` to fill in the fields
+        of the component before sending it.
+
+        If a state format is given, the component is stateless: :meth:`Component.bind` packs
+        the values into the custom id, signed with the ``component_secret`` of the client,
+        and they are passed back to the callback as the ``state`` tuple.
+        Any process sharing the secret can handle the interaction, even after a restart.
 
         Parameters
         ----------
         custom_id: str
-            The unique custom id of the component.
+            The unique custom id or custom id pattern of the component.
+        state: str | None
+            The :mod:`struct` format of the state packed into the custom id, e.g. ``"QB"``.
 
         Raises
         ------
         ValueError
-            If the custom id is not a not empty string or is not provided.
+            If the custom id is not a not empty string or is not provided,
+            or the state does not fit in a custom id.
         """
 
         def decorator(component: Component):
             if not custom_id or not isinstance(custom_id, str):
                 raise ValueError("Invalid custom id provided.")
             component.custom_id = custom_id
-            self.active_components[custom_id] = component
+            if state:
+                component._codec = StateCodec(custom_id, state, self._component_secret)
+                component.state = state
+                self.component_router.add_stateless(custom_id, component)
+            elif is_pattern(custom_id):
+                self.component_router.add(custom_id, component)
+                component.pattern = custom_id
+            else:
+                self.active_components.pin(custom_id, component)
             return component
 
         return decorator
@@ -188,7 +408,7 @@ class Client(Starlette):
         """
         A decorator to load a command into the client.
         """
-        self.commands[cmd.key] = cmd
+        self._add_routes(cmd)
         self._sync_queue.append(cmd)
         return cmd
 
@@ -202,9 +422,35 @@ class Client(Starlette):
             The commands to add to the client.
         """
         for command in commands:
-            self.commands[command.key] = command
+            self._add_routes(command)
         self._sync_queue.extend(commands)
 
+    def _add_routes(self, cmd: ApplicationCommand):
+        """
+        Registers a command and compiles its routes into the interaction routing table.
+        The routes are compiled again whenever a subcommand or autocomplete handler is attached.
+
+        This method is used internally by the client. You should not use this method.
+        """
+        previous = self.commands.get(cmd.key)
+        if previous is not cmd:
+            # a command loaded under the same key is replaced along with its routes
+            listener = self._route_listeners.pop(cmd.key, None)
+            if previous is not None and listener is not None:
+                # noinspection PyProtectedMember
+                previous._listeners.remove(listener)
+            listener = self._route_listeners[cmd.key] = partial(self._compile, cmd)
+            # noinspection PyProtectedMember
+            cmd._listeners.append(listener)
+        self.commands[cmd.key] = cmd
+        self._compile(cmd)
+
+    def _compile(self, cmd: ApplicationCommand):
+        for key in self._compiled.pop(cmd.key, ()):
+            del self._routes[key]
+        self._compiled[cmd.key] = routes = compile_routes(cmd)
+        self._routes.update(routes)
+
     async def delete_command(self, command_id: str, *, guild_id: Optional[str] = None):
         """
         Delete a command from the client.
@@ -319,6 +565,78 @@ class Client(Starlette):
             poll=poll,
         )
 
+    def broadcast(
+        self,
+        targets: Iterable[Target],
+        content: Optional[str] = None,
+        *,
+        tts: bool = False,
+        embed: Optional[Embed] = None,
+        embeds: Optional[List[Embed]] = None,
+        view: Optional[View] = None,
+        poll: Optional[Poll] = None,
+        allowed_mentions: Optional[AllowedMentions] = None,
+        concurrency: int = 16,
+    ) -> AsyncIterator[BroadcastResult]:
+        """
+        Send the same message to many channels and webhooks.
+
+        The message is encoded once and sent at bulk priority, as fast as the rate limits allow.
+        Results are yielded as the sends complete, a failed send yields its error instead of raising.
+
+        Parameters
+        ----------
+        targets: Iterable[str | PartialChannel | PartialWebhook]
+            The channels, by id or object, and webhooks to send the message to.
+        content: Optional[str]
+            The content of the message.
+        tts: bool
+            Whether the message should be sent using text-to-speech. Defaults to False.
+        embed: Optional[Embed]
+            The embed to send with the message.
+        embeds: Optional[List[Embed]]
+            A list of embeds to send with the message. Maximum of 10.
+        view: Optional[View]
+            The view to send with the message.
+        poll: Optional[Poll]
+            The poll to send with the message.
+        allowed_mentions: Optional[AllowedMentions]
+            The allowed mentions for the message.
+        concurrency: int
+            The number of sends in flight. Defaults to 16.
+
+        Returns
+        -------
+        AsyncIterator[BroadcastResult]
+            The result of every target, in the order the sends complete.
+
+        Raises
+        ------
+        ValueError
+            If the message carries files, which can not be shared between requests.
+
+        Example
+        -------
+        >>> async for result in client.broadcast(channel_ids, "We are back online!"):
+        ...     if not result.ok:
+        ...         print(result.target, result.error)
+        """
+        payload = _SendingPayload(
+            content=content,
+            tts=tts,
+            embed=embed,
+            embeds=embeds,
+            view=view,
+            poll=poll,
+            allowed_mentions=allowed_mentions,
+        )
+        data = payload.to_dict()
+        if payload.files:
+            raise ValueError("Messages with files can not be broadcast.")
+        if view:
+            self.load_view(view)
+        return broadcast(self, targets, data, concurrency=concurrency)
+
     async def me(self) -> User:
         """
         Get the client as a discord user.
@@ -347,7 +665,7 @@ class Client(Starlette):
             payload["avatar"] = avatar
         await self.http.edit_client(payload)
 
-    async def _sync(self) -> Tuple[List[aiohttp.ClientResponse], List[Dict[str, Any]]]:
+    async def _sync(self) -> Tuple[List[HTTPResponse], List[Dict[str, Any]]]:
         """
         Sync the commands to the client.
 
@@ -445,10 +763,16 @@ class Client(Starlette):
         -------
         User
         """
+        if self.entities:
+            data = self.entities.get_user(user_id)
+            if data:
+                return User(self, data)
         resp = await self.http.fetch_user(user_id)
         data = await resp.json()
         if not data.get("id"):
             return
+        if self.entities:
+            self.entities.add_user(data)
         return User(self, data)
 
     async def fetch_channel(self, channel_id: str) -> Optional[Channel]:
@@ -459,10 +783,16 @@ class Client(Starlette):
         -------
         Channel
         """
+        if self.entities:
+            data = self.entities.get_channel(channel_id)
+            if data:
+                return Channel(self, data)
         resp = await self.http.fetch_channel(channel_id)
         data = await resp.json()
         if not data.get("id"):
             return
+        if self.entities:
+            self.entities.add_channel(data)
         return Channel(self, data)
 
     async def fetch_commands(self):
@@ -0,0 +1,152 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import aiohttp
+
+from .https import Body, HTTPResponse
+
+Send = Callable[[Body], Awaitable[HTTPResponse]]
+
+
+class _Entry:
+    __slots__ = ("payload", "waiter", "inflight", "send", "wake", "task")
+
+    def __init__(self):
+        self.payload: Optional[Dict[str, Any]] = None
+        self.waiter: Optional[asyncio.Future] = None
+        self.inflight: Optional[asyncio.Future] = None
+        self.send: Optional[Send] = None
+        self.wake = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+
+def _settle(
+    waiter: asyncio.Future, result: Any = None, error: Optional[Exception] = None
+):
+    if error is not None:
+        waiter.set_exception(error)
+        # every caller may have been cancelled, the error must not be reported as unretrieved
+        waiter.exception()
+    else:
+        waiter.set_result(result)
+
+
+class EditCoalescer:
+    """
+    Merges frequent edits of the same message into one request per interval.
+
+    The first edit of a message is sent right away. Edits made while it is in flight or within
+    ``interval`` seconds after it are merged, the fields of later edits replacing those of earlier
+    ones, and sent as one request once the interval has passed. The payload of a request is fixed
+    when it is handed to the HTTP client, edits made while it waits for its rate limit bucket
+    go into the next one. Every caller awaits the request that carries its edit and receives
+    its response.
+
+    Edits uploading files are never merged, they are sent after the edits made before them.
+
+    Parameters
+    ----------
+    interval: float
+        The minimum number of seconds between two edits of the same message. Defaults to 1,
+        which keeps a message within the edit rate limit of discord.
+    """
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._submitted = 0
+        self._sent = 0
+
+    async def _run(self, key: Hashable, entry: _Entry):
+        try:
+            while entry.payload is not None:
+                payload, waiter = entry.payload, entry.waiter
+                entry.payload = entry.waiter = None
+                entry.inflight = waiter
+                self._sent += 1
+                try:
+                    _settle(waiter, await entry.send(payload))
+                except Exception as e:
+                    _settle(waiter, error=e)
+                finally:
+                    entry.inflight = None
+                    if not waiter.done():
+                        # the task was cancelled, callers must not wait forever
+                        waiter.cancel()
+                # edits made meanwhile wait out the interval unless they are flushed
+                try:
+                    await asyncio.wait_for(entry.wake.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+                entry.wake.clear()
+        finally:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+            if entry.waiter is not None:
+                entry.waiter.cancel()
+
+    async def submit(self, key: Hashable, body: Body, send: Send) -> HTTPResponse:
+        """
+        Schedules an edit of a message and waits for the request that carries it.
+
+        Parameters
+        ----------
+        key: Hashable
+            Identifies the message, edits with the same key are merged.
+        body: Dict[str, Any] | aiohttp.MultipartWriter
+            The JSON payload of the edit, or a multipart form when it uploads files.
+        send: Callable[[Body], Awaitable[HTTPResponse]]
+            Sends an edit of the message.
+
+        Raises
+        ------
+        HTTPException
+            If the request carrying the edit failed.
+        """
+        self._submitted += 1
+        if isinstance(body, aiohttp.MultipartWriter):
+            await self.flush(key)
+            self._sent += 1
+            return await send(body)
+        loop = asyncio.get_running_loop()
+        entry = self._entries.get(key)
+        if entry is not None and entry.task.get_loop() is not loop:
+            # left behind by a closed event loop
+            entry = None
+        if entry is None:
+            entry = self._entries[key] = _Entry()
+            entry.task = asyncio.create_task(self._run(key, entry))
+        if entry.payload is None:
+            entry.payload = {}
+            entry.waiter = loop.create_future()
+        entry.payload.update(body)
+        entry.send = send
+        return await asyncio.shield(entry.waiter)
+
+    async def flush(self, key: Optional[Hashable] = None):
+        """
+        Sends the pending edits without waiting for the interval and waits for them.
+
+        Parameters
+        ----------
+        key: Hashable | None
+            The message to flush. Every message is flushed if not provided.
+        """
+        entries = [self._entries[key]] if key in self._entries else []
+        if key is None:
+            entries = list(self._entries.values())
+        waiters = []
+        for entry in entries:
+            entry.wake.set()
+            waiters.extend(w for w in (entry.inflight, entry.waiter) if w is not None)
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the number of messages with pending edits, and of edits submitted and sent.
+        """
+        return {
+            "messages": len(self._entries),
+            "submitted": self._submitted,
+            "sent": self._sent,
+        }
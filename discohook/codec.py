@@ -0,0 +1,126 @@
+import json
+from typing import Any, Callable, Optional, Union
+
+from starlette.responses import JSONResponse as _StarletteJSONResponse
+
+_BACKENDS = ("msgspec", "orjson", "json")
+
+
+class JSONCodec:
+    """
+    Encodes and decodes the JSON exchanged with discord.
+
+    Parameters
+    ----------
+    name: str
+        The name of the backend.
+    dumps: Callable[[Any], bytes]
+        Encodes an object to UTF-8 JSON.
+    loads: Callable[[Union[bytes, str]], Any]
+        Decodes JSON, raising :class:`ValueError` if it is invalid.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[Union[bytes, str]], Any],
+    ):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"<JSONCodec name={self.name!r}>"
+
+    @classmethod
+    def from_name(cls, name: Optional[str] = None) -> "JSONCodec":
+        """
+        Creates the codec of a backend.
+
+        Parameters
+        ----------
+        name: str | None
+            ``msgspec``, ``orjson`` or ``json``.
+            The fastest installed backend is picked if not provided, in that order.
+
+        Raises
+        ------
+        ValueError
+            If the backend is unknown.
+        ImportError
+            If the backend is not installed.
+        """
+        if name is None:
+            for backend in _BACKENDS:
+                try:
+                    return cls.from_name(backend)
+                except ImportError:
+                    continue
+        if name == "orjson":
+            import orjson
+
+            # stdlib json turns non string keys into strings, orjson refuses them by default
+            option = orjson.OPT_NON_STR_KEYS
+            return cls(
+                "orjson", lambda obj: orjson.dumps(obj, option=option), orjson.loads
+            )
+        if name == "msgspec":
+            import msgspec
+
+            decode = msgspec.json.Decoder().decode
+
+            def loads(data: Union[bytes, str]) -> Any:
+                try:
+                    return decode(data)
+                except msgspec.DecodeError as e:
+                    raise ValueError(str(e)) from None
+
+            return cls("msgspec", msgspec.json.Encoder().encode, loads)
+        if name == "json":
+            encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+            return cls("json", lambda obj: encode(obj).encode(), json.loads)
+        raise ValueError(f"unknown json codec `{name}`, expected one of {_BACKENDS}")
+
+
+_codec = JSONCodec.from_name()
+
+
+def get_codec() -> JSONCodec:
+    """
+    Returns the codec in use.
+    """
+    return _codec
+
+
+def set_codec(codec: Union[JSONCodec, str, None] = None) -> JSONCodec:
+    """
+    Sets the codec used by the library.
+
+    Payloads are built before they reach a client, so the codec is shared by the whole process.
+
+    Parameters
+    ----------
+    codec: JSONCodec | str | None
+        The codec, or the name of a backend passed to :meth:`JSONCodec.from_name`.
+    """
+    global _codec
+    _codec = codec if isinstance(codec, JSONCodec) else JSONCodec.from_name(codec)
+    return _codec
+
+
+def dumps(obj: Any) -> bytes:
+    return _codec.dumps(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    return _codec.loads(data)
+
+
+class JSONResponse(_StarletteJSONResponse):
+    """
+    A starlette JSON response rendered with the codec in use.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from .base import Interactable
 from .enums import (
@@ -10,7 +10,7 @@ from .enums import (
 )
 from .option import Option
 from .permission import Permission
-from .utils import Handler, find_description
+from .utils import Binder, Handler, find_description, make_binder
 
 
 class SubCommand:
@@ -42,6 +42,17 @@ class SubCommand:
         self.callback = callback
         self.description = description
         self.autocompletion_handler: Optional[Handler] = None
+        self._autocomplete_binder: Binder = make_binder(None)
+        self._command: Optional["ApplicationCommand"] = None
+
+    @property
+    def callback(self) -> Optional[Handler]:
+        return self._callback
+
+    @callback.setter
+    def callback(self, coro: Optional[Handler]):
+        self._callback = coro
+        self._binder: Binder = make_binder(coro)
 
     def __call__(self, *args, **kwargs):
         if not self.callback:
@@ -56,6 +67,9 @@ class SubCommand:
         A decorator to register a callback for the subcommand's autocomplete options.
         """
         self.autocompletion_handler = coro
+        self._autocomplete_binder = make_binder(coro)
+        if self._command:
+            self._command._changed()
         return coro
 
     def to_dict(self) -> Dict[str, Any]:
@@ -96,6 +110,17 @@ class ApplicationCommand(Interactable):
          Installation context(s) where the command is available. only for globally-scoped commands.
     contexts: List[InteractionContextType] | None
          Interaction context(s) where the command can be used, only for globally-scoped commands.
+    auto_defer: float | None
+        Seconds after the interaction was created at which it is deferred automatically
+        if the callback has not responded yet. Discord allows 3 seconds to acknowledge.
+        Later calls to :meth:`ResponseAdapter.send` edit the deferred response instead.
+    auto_defer_ephemeral: bool
+        Whether the automatic defer, by ``auto_defer`` or ``background``, is ephemeral.
+        A response sent afterwards whose ``ephemeral`` differs from it becomes a followup message.
+        Defaults to False.
+    background: bool
+        Whether to acknowledge the interaction immediately and run the callback
+        on the client's worker pool. Defaults to False.
     """
 
     def __init__(
@@ -110,6 +135,9 @@ class ApplicationCommand(Interactable):
         permissions: Optional[List[Permission]] = None,
         type: ApplicationCommandType = ApplicationCommandType.slash,
         guild_id: Optional[str] = None,
+        auto_defer: Optional[float] = None,
+        auto_defer_ephemeral: bool = False,
+        background: bool = False,
         callback: Handler,
     ):
         super().__init__()
@@ -131,10 +159,24 @@ class ApplicationCommand(Interactable):
         )
         self.permissions = permissions
         self.guild_id = guild_id
-        self.callback: Handler = callback
+        self.callback = callback
         self.data: Dict[str, Any] = {}
         self.subcommands: Dict[str, SubCommand] = {}
         self.autocompletion_handler: Optional[Handler] = None
+        self._autocomplete_binder: Binder = make_binder(None)
+        self.auto_defer = auto_defer
+        self.auto_defer_ephemeral = auto_defer_ephemeral
+        self.background = background
+        self._listeners: List[Callable[[], Any]] = []
+
+    @property
+    def callback(self) -> Handler:
+        return self._callback
+
+    @callback.setter
+    def callback(self, coro: Handler):
+        self._callback = coro
+        self._binder: Binder = make_binder(coro)
 
     def __call__(self, *args, **kwargs):
         if not self.callback:
@@ -146,8 +188,15 @@ class ApplicationCommand(Interactable):
         A decorator to register a callback for the command's autocomplete options.
         """
         self.autocompletion_handler = coro
+        self._autocomplete_binder = make_binder(coro)
+        self._changed()
         return coro
 
+    def _changed(self):
+        # the clients the command is loaded into recompile its routes
+        for listener in self._listeners:
+            listener()
+
     def subcommand(
         self,
         name: Optional[str] = None,
@@ -187,6 +236,8 @@ class ApplicationCommand(Interactable):
             if not asyncio.iscoroutinefunction(coro):
                 raise TypeError("subcommand callback must be a coroutine")
             self.subcommands[name] = subcommand
+            subcommand._command = self
+            self._changed()
             return subcommand
 
         return decorator
@@ -230,6 +281,9 @@ def slash(
     guild_id: Optional[str] = None,
     integration_types: Optional[List[ApplicationIntegrationType]] = None,
     contexts: Optional[List[InteractionContextType]] = None,
+    auto_defer: Optional[float] = None,
+    auto_defer_ephemeral: bool = False,
+    background: bool = False,
 ):
     """
     A decorator to register a slash command with its callback.
@@ -245,6 +299,9 @@ def slash(
             guild_id=guild_id,
             integration_types=integration_types,
             contexts=contexts,
+            auto_defer=auto_defer,
+            auto_defer_ephemeral=auto_defer_ephemeral,
+            background=background,
             callback=coro,
         )
 
@@ -259,6 +316,9 @@ def user(
     guild_id: Optional[str] = None,
     integration_types: Optional[List[ApplicationIntegrationType]] = None,
     contexts: Optional[List[InteractionContextType]] = None,
+    auto_defer: Optional[float] = None,
+    auto_defer_ephemeral: bool = False,
+    background: bool = False,
 ):
     """
     A decorator to register a user command with its callback.
@@ -273,6 +333,9 @@ def user(
             type=ApplicationCommandType.user,
             integration_types=integration_types,
             contexts=contexts,
+            auto_defer=auto_defer,
+            auto_defer_ephemeral=auto_defer_ephemeral,
+            background=background,
             callback=coro,
         )
 
@@ -287,6 +350,9 @@ def message(
     guild_id: Optional[str] = None,
     integration_types: Optional[List[ApplicationIntegrationType]] = None,
     contexts: Optional[List[InteractionContextType]] = None,
+    auto_defer: Optional[float] = None,
+    auto_defer_ephemeral: bool = False,
+    background: bool = False,
 ):
     """
     A decorator to register a message command with its callback.
@@ -301,6 +367,9 @@ def message(
             type=ApplicationCommandType.message,
             integration_types=integration_types,
             contexts=contexts,
+            auto_defer=auto_defer,
+            auto_defer_ephemeral=auto_defer_ephemeral,
+            background=background,
             callback=coro,
         )
 
@@ -1,7 +1,10 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any, Union
 
 import aiohttp
 
+if TYPE_CHECKING:
+    from .https import HTTPResponse
+
 
 class InteractionTypeMismatch(Exception):
     """Raised when the interaction type is not the expected type."""
@@ -30,7 +33,38 @@ class UnknownInteractionType(Exception):
 class HTTPException(Exception):
     """Raised when an HTTP request operation fails."""
 
-    def __init__(self, resp: aiohttp.ClientResponse, data: Any):
+    def __init__(self, resp: Union["HTTPResponse", aiohttp.ClientResponse], data: Any):
         self.resp = resp
-        message = f"[{resp.method}] {resp.url.path} {resp.status} with code({data['code']}): {data['message']}"
+        self.data = data
+        if isinstance(data, dict) and "code" in data:
+            message = f"[{resp.method}] {resp.url.path} {resp.status} with code({data['code']}): {data.get('message')}"
+        else:
+            # proxies and outages answer with html or plain text
+            message = (
+                f"[{resp.method}] {resp.url.path} {resp.status}: {str(data)[:200]}"
+            )
+        super().__init__(message)
+
+
+class WorkerPoolFull(Exception):
+    """Raised when the background worker pool can not accept more work."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+class AttachmentTooLarge(Exception):
+    """Raised when an attachment is larger than the size allowed to download."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+class CircuitOpen(Exception):
+    """Raised when a request is not sent because discord is failing."""
+
+    def __init__(self, message: str):
+        self.message = message
         super().__init__(message)
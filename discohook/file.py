@@ -1,4 +1,50 @@
-from typing import Optional
+import asyncio
+import os
+from typing import IO, AsyncIterable, Dict, Optional, Union
+
+import aiohttp
+
+#: The number of bytes read from disk at a time when a file is uploaded from a path.
+CHUNK_SIZE = 64 * 1024
+
+FileContent = Union[bytes, str, "os.PathLike[str]", IO[bytes], AsyncIterable[bytes]]
+
+
+class _PathPayload(aiohttp.payload.Payload):
+    """
+    Streams a file from disk in chunks, opening it anew for every write
+    so a request can be retried and no file handle outlives it.
+    """
+
+    _autoclose = True
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], **kwargs):
+        super().__init__(path, **kwargs)
+        self._size = os.path.getsize(path)
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        with open(self._value, "rb") as f:
+            return f.read().decode(encoding, errors)
+
+    async def write(self, writer):
+        await self.write_with_length(writer, None)
+
+    async def write_with_length(self, writer, content_length: Optional[int]):
+        # reads go to the default executor so a slow disk does not block the event loop
+        loop = asyncio.get_running_loop()
+        f = await loop.run_in_executor(None, open, self._value, "rb")
+        try:
+            remaining = content_length
+            while remaining is None or remaining > 0:
+                size = CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining)
+                chunk = await loop.run_in_executor(None, f.read, size)
+                if not chunk:
+                    break
+                await writer.write(chunk)
+                if remaining is not None:
+                    remaining -= len(chunk)
+        finally:
+            await loop.run_in_executor(None, f.close)
 
 
 class File:
@@ -9,8 +55,12 @@ class File:
     ----------
     name: str
         The name of the file.
-    content: bytes
-        The content of the file in bytes.
+    content: bytes | str | os.PathLike | IO[bytes] | AsyncIterable[bytes]
+        The content of the file. A path, as a :class:`str` or e.g. a :class:`pathlib.Path`,
+        is streamed from disk when the file is sent, a binary file object is read in chunks
+        and an async iterator is streamed as it yields, so none of them is held in memory
+        as a whole. Text is not accepted as content, encode it to bytes.
+        File objects are closed once sent, and like async iterators can only be sent once.
     description: str | None
         The description of the file.
     spoiler: bool
@@ -21,7 +71,7 @@ class File:
         self,
         name: str,
         *,
-        content: bytes,
+        content: FileContent,
         spoiler: bool = False,
         description: Optional[str] = None
     ):
@@ -29,3 +79,11 @@ class File:
         self.content = content
         self.spoiler = spoiler
         self.description = description
+
+    def to_payload(self, headers: Dict[str, str]) -> aiohttp.payload.Payload:
+        """
+        Returns the multipart part carrying the content of the file.
+        """
+        if isinstance(self.content, (str, os.PathLike)):
+            return _PathPayload(self.content, headers=headers)
+        return aiohttp.payload.get_payload(self.content, headers=headers)
@@ -34,10 +34,17 @@ class PartialGuild:
         -------
         Optional[:class:`Member`]
         """
+        entities = self.client.entities
+        if entities:
+            data = entities.get_member(self.id, user_id)
+            if data:
+                return Member(self.client, unwrap_user(data, self.id))
         resp = await self.client.http.fetch_guild_member(self.id, user_id)
         data = await resp.json()
         if not data.get("user"):
             return
+        if entities:
+            entities.add_member(self.id, data)
         return Member(self.client, unwrap_user(data, self.id))
 
     async def fetch_channels(self) -> List[Channel]:
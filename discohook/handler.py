@@ -1,11 +1,15 @@
 import asyncio
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
 
-from nacl.exceptions import BadSignatureError
-from nacl.signing import VerifyKey
+from starlette.background import BackgroundTask
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 
-from .command import ApplicationCommand, ApplicationCommandOptionType
+from .base import Component, Interactable
+from .codec import JSONResponse
+from .command import ApplicationCommand, ApplicationCommandOptionType, SubCommand
 from .enums import (
     ApplicationCommandType,
     ComponentType,
@@ -16,148 +20,283 @@ from .errors import CheckFailure, UnknownInteractionType
 from .interaction import Interaction
 from .resolver import (
     build_context_menu_param,
-    build_modal_params,
     build_select_menu_values,
-    build_slash_command_params,
+    parse_modal_options,
+    parse_slash_command_options,
 )
+from .retry import TOKEN_LIFETIME, interaction_deadline
+from .utils import Binder
 
+RouteKey = Tuple[int, int, str, Optional[str], Tuple[str, ...]]
+Invoker = Callable[[Interaction], Awaitable[Any]]
 
-def _build_key(interaction: Interaction) -> str:
-    specific_source_guild = interaction.data.get("guild_id")
-    if specific_source_guild:
-        return f"{interaction.data['name']}:{specific_source_guild}:{interaction.data['type']}"
-    return f"{interaction.data['name']}:{interaction.data['type']}"
 
+def _route_key(interaction: Interaction) -> RouteKey:
+    data = interaction.data
+    options = data.get("options")
+    path = ()
+    if options and options[0]["type"] == ApplicationCommandOptionType.subcommand:
+        path = (options[0]["name"],)
+    return (
+        interaction.payload["type"],
+        data["type"],
+        data["name"],
+        data.get("guild_id"),
+        path,
+    )
 
-# noinspection PyProtectedMember
-async def _handler(request: Request):
+
+def compile_routes(cmd: ApplicationCommand) -> Dict[RouteKey, Invoker]:
     """
-    Handles all interactions from discord
+    Compiles the routes of a command into invokers keyed by
+    (interaction type, command type, name, guild id, subcommand path).
 
     Note: This is not a public API and should not be used outside the library
     """
-    signature = bytes.fromhex(request.headers.get("X-Signature-Ed25519", ""))
-    timestamp = request.headers.get("X-Signature-Timestamp", "")
-    message = timestamp.encode() + await request.body()
-    public_key = bytes.fromhex(request.app.public_key)
+    guild_id = str(cmd.guild_id) if cmd.guild_id else None
+
+    def key(interaction_type: InteractionType, *path: str) -> RouteKey:
+        return interaction_type, cmd.type, cmd.name, guild_id, path
+
+    if cmd.type != ApplicationCommandType.slash:
+        return {
+            key(InteractionType.app_command): partial(_invoke, cmd, _context_menu(cmd))
+        }
+    routes = {
+        key(InteractionType.app_command): partial(
+            _invoke, cmd, _slash(cmd, cmd._binder)
+        )
+    }
+    if cmd.autocompletion_handler:
+        routes[key(InteractionType.autocomplete)] = _slash(
+            cmd.autocompletion_handler, cmd._autocomplete_binder
+        )
+    for name, subcommand in cmd.subcommands.items():
+        routes[key(InteractionType.app_command, name)] = partial(
+            _invoke, cmd, _slash(subcommand, subcommand._binder)
+        )
+        if subcommand.autocompletion_handler:
+            routes[key(InteractionType.autocomplete, name)] = _slash(
+                subcommand.autocompletion_handler, subcommand._autocomplete_binder
+            )
+    return routes
+
+
+def _context_menu(cmd: ApplicationCommand) -> Invoker:
+    async def call(interaction: Interaction):
+        await cmd(interaction, build_context_menu_param(interaction))
+
+    return call
+
+
+def _slash(
+    target: Union[ApplicationCommand, SubCommand, Callable], binder: Binder
+) -> Invoker:
+    async def call(interaction: Interaction):
+        options = parse_slash_command_options(interaction)
+        if options is None:
+            return await target(interaction)
+        args, kwargs = binder(options)
+        await target(interaction, *args, **kwargs)
+
+    return call
+
+
+def _component(
+    interaction: Interaction,
+    component: Component,
+    fields: Optional[Dict[str, Any]] = None,
+):
+    fields = fields or {}
+    if interaction.type == InteractionType.modal_submit:
+        args, kwargs = component._binder({**fields, **parse_modal_options(interaction)})
+        return component(interaction, *args, **kwargs)
+    if interaction.data["component_type"] == ComponentType.button:
+        return component(interaction, **fields)
+    return component(interaction, build_select_menu_values(interaction), **fields)
+
+
+# noinspection PyProtectedMember
+def _auto_defer(interaction: Interaction, ephemeral: bool):
+    if interaction._responded:
+        return
+    interaction._responded = True
+    interaction._auto_deferred = asyncio.create_task(
+        interaction.response.defer(ephemeral=ephemeral)
+    )
+
+
+def _watch(
+    interaction: Interaction, target: Interactable
+) -> Optional[asyncio.TimerHandle]:
+    if target.auto_defer is None:
+        return
+    delay = interaction.created_at + target.auto_defer - time.time()
+    return asyncio.get_running_loop().call_later(
+        max(delay, 0), _auto_defer, interaction, target.auto_defer_ephemeral
+    )
+
+
+# noinspection PyProtectedMember
+async def _call(interaction: Interaction, target: Interactable, call: Invoker):
+    watchdog = _watch(interaction, target)
     try:
-        VerifyKey(public_key).verify(message, signature)
-    except BadSignatureError:
-        return Response(content="BadSignature", status_code=401)
-    data = await request.json()
-    interaction = Interaction(request.app, data)
+        if target.checks:
+            results = await asyncio.gather(
+                *[check(interaction) for check in target.checks]
+            )
+            for result in results:
+                if not isinstance(result, bool):
+                    raise CheckFailure(f"check returned {type(result)}, expected bool")
+            if not all(results):
+                kind = "component" if isinstance(target, Component) else "command"
+                raise CheckFailure(f"{kind} checks failed")
+        await call(interaction)
+    except Exception as e:
+        if not target._error_handler:
+            raise e
+        await target._error_handler(interaction, e)
+    finally:
+        if watchdog:
+            watchdog.cancel()
+    if interaction._auto_deferred:
+        await interaction._auto_deferred
+
+
+# noinspection PyProtectedMember
+async def _background(interaction: Interaction, target: Interactable, call: Invoker):
     try:
-        if interaction.type == InteractionType.ping:
-            return JSONResponse({"type": InteractionCallbackType.pong}, status_code=200)
-
-        elif interaction.type == InteractionType.app_command:
-            cmd: ApplicationCommand = request.app.commands.get(_build_key(interaction))
-            if not cmd:
-                raise NotImplementedError(
-                    f"command `{interaction.data['name']}` ({interaction.data['id']}) not found"
-                )
-            try:
-                if cmd.checks:
-                    results = await asyncio.gather(
-                        *[check(interaction) for check in cmd.checks]
-                    )
-                    for result in results:
-                        if not isinstance(result, bool):
-                            raise CheckFailure(
-                                f"check returned {type(result)}, expected bool"
-                            )
-                    if not all(results):
-                        raise CheckFailure(f"command checks failed")
-
-                if not (interaction.data["type"] == ApplicationCommandType.slash):
-                    await cmd(interaction, build_context_menu_param(interaction))
-
-                elif interaction.data.get("options") and (
-                    interaction.data["options"][0]["type"]
-                    == ApplicationCommandOptionType.subcommand
-                ):
-                    subcommand = cmd.subcommands[interaction.data["options"][0]["name"]]
-                    args, kwargs = build_slash_command_params(
-                        subcommand.callback, interaction
-                    )
-                    await subcommand(interaction, *args, **kwargs)
-                else:
-                    args, kwargs = build_slash_command_params(cmd.callback, interaction)
-                    await cmd(interaction, *args, **kwargs)
-            except Exception as e:
-                if not cmd._error_handler:
-                    raise e
-                await cmd._error_handler(interaction, e)
-
-        elif interaction.type == InteractionType.autocomplete:
-            cmd: ApplicationCommand = request.app.commands.get(_build_key(interaction))
-            if not cmd:
-                raise Exception(
-                    f"command `{interaction.data['name']}` ({interaction.data['id']}) not found"
-                )
-            if (
-                interaction.data["options"][0]["type"]
-                == ApplicationCommandOptionType.subcommand
-            ):
-                subcommand = cmd.subcommands[interaction.data["options"][0]["name"]]
-                args, kwargs = build_slash_command_params(
-                    subcommand.autocompletion_handler, interaction
-                )
-                await subcommand.autocompletion_handler(interaction, *args, **kwargs)
-            elif not cmd.autocompletion_handler:
-                raise Exception(
-                    f"command `{interaction.data['name']}` ({interaction.data['id']}) has no autocompletion handler"
-                )
-            else:
-                args, kwargs = build_slash_command_params(
-                    cmd.autocompletion_handler, interaction
-                )
-                await cmd.autocompletion_handler(interaction, *args, **kwargs)
-
-        elif interaction.type in (
-            InteractionType.component,
-            InteractionType.modal_submit,
-        ):
-            custom_id = interaction.data["custom_id"]
-            if request.app._custom_id_parser:
-                custom_id = await request.app._custom_id_parser(interaction, custom_id)
-            component = request.app.active_components.get(custom_id)
-            if not component:
-                raise NotImplementedError(f"component `{custom_id}` not found")
-            try:
-                if component.checks:
-                    results = await asyncio.gather(
-                        *[check(interaction) for check in component.checks]
-                    )
-                    for result in results:
-                        if not isinstance(result, bool):
-                            raise CheckFailure(
-                                f"check returned {type(result)}, expected bool"
-                            )
-                    if not all(results):
-                        raise CheckFailure("component checks failed")
-
-                if interaction.type == InteractionType.component:
-                    if interaction.data["component_type"] == ComponentType.button:
-                        await component(interaction)
-                    else:
-                        await component(
-                            interaction, build_select_menu_values(interaction)
-                        )
-                elif interaction.type == InteractionType.modal_submit:
-                    args, kwargs = build_modal_params(component.callback, interaction)
-                    await component(interaction, *args, **kwargs)
-            except Exception as e:
-                if not component._error_handler:
-                    raise e
-                await component._error_handler(interaction, e)
-        else:
-            raise UnknownInteractionType(f"unknown interaction type {interaction.type}")
+        await _call(interaction, target, call)
+    except Exception as e:
+        if not interaction.client._interaction_error_handler:
+            raise e
+        await interaction.client._interaction_error_handler(interaction, e)
+
+
+async def _invoke(target: Interactable, call: Invoker, interaction: Interaction):
+    if not target.background:
+        return await _call(interaction, target, call)
+    interaction.client.workers.submit(_background, interaction, target, call)
+    interaction._responded = True
+    interaction._auto_deferred = asyncio.create_task(
+        interaction.response.defer(ephemeral=target.auto_defer_ephemeral)
+    )
+    await interaction._auto_deferred
+
+
+async def _ping(_: Interaction):
+    return JSONResponse({"type": InteractionCallbackType.pong}, status_code=200)
+
+
+# noinspection PyProtectedMember
+async def _route(interaction: Interaction):
+    app = interaction.client
+    key = _route_key(interaction)
+    invoke = app._routes.get(key)
+    if invoke:
+        return await invoke(interaction)
+    if interaction.type == InteractionType.autocomplete:
+        raise Exception(
+            f"command `{interaction.data['name']}` ({interaction.data['id']}) has no autocompletion handler"
+        )
+    raise NotImplementedError(
+        f"command `{interaction.data['name']}` ({interaction.data['id']}) not found"
+    )
+
+
+# noinspection PyProtectedMember
+async def _interact(interaction: Interaction):
+    app = interaction.client
+    custom_id = interaction.data["custom_id"]
+    if app._custom_id_parser:
+        custom_id = await app._custom_id_parser(interaction, custom_id)
+    component = app.active_components.get(custom_id)
+    fields = None
+    if not component:
+        routed = app.component_router.match(custom_id)
+        if not routed:
+            raise NotImplementedError(f"component `{custom_id}` not found")
+        component, fields = routed
+    await _invoke(
+        component, partial(_component, component=component, fields=fields), interaction
+    )
+
+
+_DISPATCH: Dict[int, Invoker] = {
+    InteractionType.ping: _ping,
+    InteractionType.app_command: _route,
+    InteractionType.autocomplete: _route,
+    InteractionType.component: _interact,
+    InteractionType.modal_submit: _interact,
+}
+
+
+async def _dispatch(interaction: Interaction):
+    dispatch = _DISPATCH.get(interaction.payload["type"])
+    if not dispatch:
+        raise UnknownInteractionType(f"unknown interaction type {interaction.type}")
+    return await dispatch(interaction)
+
+
+# noinspection PyProtectedMember
+async def _run(interaction: Interaction) -> Response:
+    app = interaction.client
+    try:
+        response = await _dispatch(interaction)
     except Exception as e:
-        if request.app._interaction_error_handler:
-            await request.app._interaction_error_handler(interaction, e)
+        if app._interaction_error_handler:
+            await app._interaction_error_handler(interaction, e)
             return Response(status_code=500)
         else:
             raise e from None
     else:
-        return Response(status_code=200)
+        return response or Response(status_code=200)
+
+
+async def _drain(interaction: Interaction, task: asyncio.Task):
+    interaction._inline_sent.set()
+    await task
+
+
+# noinspection PyProtectedMember
+async def _handler(request: Request):
+    """
+    Handles all interactions from discord
+
+    Note: This is not a public API and should not be used outside the library
+    """
+    body = await request.body()
+    if not request.app._verify_request(
+        request.headers.get("X-Signature-Ed25519", ""),
+        request.headers.get("X-Signature-Timestamp", ""),
+        body,
+    ):
+        return Response(content="BadSignature", status_code=401)
+    interaction = Interaction(request.app, request.app.codec.loads(body))
+    if request.app.entities:
+        request.app.entities.ingest(interaction.payload)
+    if request.app.prefetch_attachment_size is not None:
+        interaction.prefetch_attachments(max_size=request.app.prefetch_attachment_size)
+    # requests made on behalf of the interaction are not retried past the lifetime of its token
+    interaction_deadline.set(interaction.created_at + TOKEN_LIFETIME)
+    if not request.app.inline_responses or interaction.type == InteractionType.ping:
+        return await _run(interaction)
+
+    # the first response produced by the callback becomes the body of this request,
+    # the callback keeps running in the background once it has been delivered
+    interaction._inline = asyncio.get_running_loop().create_future()
+    interaction._inline_sent = asyncio.Event()
+    task = asyncio.create_task(_run(interaction))
+    await asyncio.wait(
+        (task, interaction._inline),
+        timeout=request.app.inline_response_timeout,
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    if interaction._inline.done():
+        return JSONResponse(
+            interaction._inline.result(),
+            background=BackgroundTask(_drain, interaction, task),
+        )
+    # past the deadline, any response from here on goes through the callback endpoint
+    interaction._inline.cancel()
+    return await task
@@ -0,0 +1,218 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from .errors import CircuitOpen
+
+
+class AdaptiveLimit:
+    """
+    Adapts the number of requests in flight to how discord is coping, additive increase
+    and multiplicative decrease (AIMD).
+
+    The limit shrinks when requests are rate limited or fail, or when responses stay noticeably
+    slower than usual, and grows back by one for every window of successful requests.
+    The usual latency is averaged over the last few hundred responses, so it follows
+    a lasting change of the network while a short slowdown stands out against it.
+
+    Parameters
+    ----------
+    maximum: int
+        The limit discord is assumed to cope with, and the one started from.
+    minimum: int
+        The limit never shrinks below it. Defaults to 4.
+    backoff: float
+        The factor the limit is multiplied by when it shrinks. Defaults to 0.5.
+    latency_tolerance: float
+        How many times slower than the usual latency responses may get before the limit shrinks.
+        Defaults to 3.
+    patience: int
+        The number of consecutive responses that have to be slow before the limit shrinks,
+        so a few slow responses among healthy traffic do not shrink it. Defaults to 10.
+    cooldown: float
+        The seconds the limit is left alone after it shrank, so one burst of failures
+        only shrinks it once. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        *,
+        minimum: int = 4,
+        backoff: float = 0.5,
+        latency_tolerance: float = 3.0,
+        patience: int = 10,
+        cooldown: float = 1.0,
+    ):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.patience = patience
+        self.cooldown = cooldown
+        self.limit = float(maximum)
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._slow = 0
+        self._decreased_at = 0.0
+        self._decreases = 0
+
+    def _observe(self, latency: float) -> bool:
+        if self._latency is None:
+            self._latency = self._baseline = latency
+            return False
+        self._latency += (latency - self._latency) * 0.1
+        self._baseline += (latency - self._baseline) * 0.005
+        # a floor keeps jitter on very fast responses from counting as a slowdown
+        slow = self._latency > max(self._baseline, 0.05) * self.latency_tolerance
+        self._slow = self._slow + 1 if slow else 0
+        return self._slow >= self.patience
+
+    def record(self, overloaded: bool, latency: Optional[float] = None) -> int:
+        """
+        Records the outcome of a request and returns the new limit.
+
+        Parameters
+        ----------
+        overloaded: bool
+            Whether the request was rate limited, failed or answered with a 5xx.
+        latency: float | None
+            The seconds the request took to be answered, if it is representative.
+        """
+        slow = latency is not None and self._observe(latency)
+        if overloaded or slow:
+            now = time.monotonic()
+            if now - self._decreased_at >= self.cooldown:
+                self.limit = max(float(self.minimum), self.limit * self.backoff)
+                self._decreased_at = now
+                self._decreases += 1
+                self._slow = 0
+        else:
+            self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+        return int(self.limit)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the current limit, the latencies it is derived from and how often it shrank.
+        """
+        return {
+            "limit": int(self.limit),
+            "maximum": self.maximum,
+            "latency": self._latency,
+            "baseline": self._baseline,
+            "decreases": self._decreases,
+        }
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to discord while it is failing.
+
+    Interaction callbacks neither pass through nor count towards the breaker of a
+    :class:`HTTPClient`, a failing route must not keep the 3 seconds to answer from being used.
+
+    After a number of consecutive failures (5xx responses, connection errors and timeouts)
+    the circuit opens and requests fail fast with :class:`CircuitOpen`, or wait if ``wait``
+    is set. Once ``recovery`` seconds have passed a single request is let through as a probe,
+    its success closes the circuit and its failure opens it again.
+
+    Parameters
+    ----------
+    failures: int
+        The number of consecutive failures that open the circuit. Defaults to 10.
+    recovery: float
+        The seconds the circuit stays open before it is probed. Defaults to 15.
+    wait: bool
+        Whether requests wait for the circuit to close instead of failing fast,
+        for as long as their deadline allows. Defaults to False.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, failures: int = 10, recovery: float = 15.0, *, wait: bool = False
+    ):
+        self.failures = failures
+        self.recovery = recovery
+        self.wait = wait
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._trips = 0
+        self._rejected = 0
+
+    async def acquire(self, deadline: Optional[float] = None) -> bool:
+        """
+        Returns once a request may be sent.
+
+        Parameters
+        ----------
+        deadline: float | None
+            The wall clock time by which the request must have completed.
+
+        Returns
+        -------
+        bool
+            Whether the request is the probe of a circuit that was open.
+
+        Raises
+        ------
+        CircuitOpen
+            If the circuit is open and requests do not wait, or the deadline would pass waiting.
+        """
+        while self.state != self.CLOSED:
+            now = time.monotonic()
+            if self.state == self.OPEN and now >= self._opened_at + self.recovery:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            # the outcome of the probe is awaited in short steps
+            delay = (
+                self._opened_at + self.recovery - now
+                if self.state == self.OPEN
+                else 0.1
+            )
+            if not self.wait or (
+                deadline is not None and time.time() + delay >= deadline
+            ):
+                self._rejected += 1
+                raise CircuitOpen("discord is failing, the request was not sent")
+            await asyncio.sleep(delay)
+        return False
+
+    def release(self):
+        """
+        Lets another probe through after the probe ended without an outcome.
+        """
+        self._probing = False
+
+    def record(self, ok: bool):
+        """
+        Records whether a request succeeded.
+        """
+        self._probing = False
+        if ok:
+            self._failures = 0
+            self.state = self.CLOSED
+            return
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failures:
+            if self.state != self.OPEN:
+                self._trips += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the state of the circuit, how often it opened and how many requests it rejected.
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "trips": self._trips,
+            "rejected": self._rejected,
+        }
@@ -1,22 +1,335 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import asyncio
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
 
+from .codec import JSONCodec, get_codec
+from .cache import CacheKey, ResponseCache
 from .errors import HTTPException
+from .health import AdaptiveLimit, CircuitBreaker
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, interaction_deadline
+from .scheduler import Priority, Scheduler, request_priority
 
 if TYPE_CHECKING:
     from .client import Client
+    from .coalesce import EditCoalescer
+
+#: A JSON message payload, already encoded or not, or a multipart form when it carries files.
+Body = Union[Dict[str, Any], bytes, aiohttp.MultipartWriter]
+
+_KEPT_HEADERS = frozenset({"content-type", "retry-after", "location", "via"})
+_UNSET = object()
+
+CONNECTOR_DEFAULTS: Dict[str, Any] = {
+    "limit": 100,
+    "limit_per_host": 0,
+    "keepalive_timeout": 60,
+    "ttl_dns_cache": 300,
+}
+# downloads from the cdn get connections of their own, so they never take the ones
+# interaction callbacks rely on
+DOWNLOAD_CONNECTOR_DEFAULTS: Dict[str, Any] = {
+    "limit": 10,
+    "limit_per_host": 0,
+    "keepalive_timeout": 60,
+    "ttl_dns_cache": 300,
+}
+# the warm-up only saves the first request a handshake, startup must not wait on it for long
+WARM_UP_TIMEOUT = 3.0
+
+
+def _decode(body: bytes, json_codec: Optional[JSONCodec] = None) -> Any:
+    """
+    Returns a decoded JSON body, or its text if it is not JSON.
+    """
+    if not body:
+        return
+    try:
+        return (json_codec or get_codec()).loads(body)
+    except ValueError:
+        return body.decode(errors="replace")
+
+
+async def _read(
+    resp: aiohttp.ClientResponse, json_codec: Optional[JSONCodec] = None
+) -> Any:
+    return _decode(await resp.read(), json_codec)
+
+
+def _body(payload: Body) -> Dict[str, Any]:
+    if isinstance(payload, aiohttp.MultipartWriter):
+        return {"form": payload}
+    if isinstance(payload, bytes):
+        return {"data": payload}
+    return {"json": payload}
+
+
+def _consumed(form: Optional[aiohttp.MultipartWriter]) -> bool:
+    # parts streamed from file objects and async iterators can only be sent once
+    return form is not None and any(
+        getattr(part, "consumed", False) for part, _, _ in form
+    )
+
+
+class HTTPResponse:
+    """
+    The outcome of a request to discord.
+
+    The body is read as soon as the response arrives, so the connection goes back to the pool
+    right away. Instances are immutable and may be shared by the callers of the same request.
+
+    Attributes
+    ----------
+    method: str
+        The HTTP method of the request.
+    url: yarl.URL
+        The URL of the request.
+    status: int
+        The status code of the response.
+    headers: CIMultiDictProxy[str]
+        The content type, retry and rate limit headers of the response.
+    body: bytes
+        The raw body of the response.
+    """
+
+    __slots__ = ("method", "url", "status", "headers", "body", "_data", "_codec")
+
+    def __init__(
+        self,
+        resp: aiohttp.ClientResponse,
+        body: bytes,
+        json_codec: Optional[JSONCodec] = None,
+    ):
+        kept = CIMultiDict(
+            (key, value)
+            for key, value in resp.headers.items()
+            if key.lower() in _KEPT_HEADERS or key.lower().startswith("x-ratelimit")
+        )
+        for name, value in (
+            ("method", resp.method),
+            ("url", resp.url),
+            ("status", resp.status),
+            ("headers", CIMultiDictProxy(kept)),
+            ("body", body),
+            ("_data", _UNSET),
+            ("_codec", json_codec),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("HTTPResponse is immutable")
+
+    def __repr__(self) -> str:
+        return f"<HTTPResponse [{self.method}] {self.url.path} {self.status}>"
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def data(self) -> Any:
+        """
+        The decoded JSON body, or its text if it is not JSON. Decoded once and shared,
+        use :meth:`json` for a copy that can be changed.
+        """
+        if self._data is _UNSET:
+            object.__setattr__(self, "_data", _decode(self.body, self._codec))
+        return self._data
+
+    async def json(self, **_) -> Any:
+        """
+        Returns a fresh decoding of the body, as :meth:`aiohttp.ClientResponse.json` did.
+        """
+        return _decode(self.body, self._codec)
+
+    async def text(self) -> str:
+        return self.body.decode(errors="replace")
+
+    async def read(self) -> bytes:
+        return self.body
+
+    def release(self):
+        pass
 
 
 class HTTPClient:
-    """Represents an HTTP client for Discord's API."""
-
+    """
+    Represents an HTTP client for Discord's API.
+
+    Parameters
+    ----------
+    client: Client
+        The client this HTTP client belongs to.
+    token: str
+        The token of the bot.
+    connector_options: Dict[str, Any] | None
+        Keyword arguments for the :class:`aiohttp.TCPConnector` of the session,
+        merged over :data:`CONNECTOR_DEFAULTS`.
+    retry_policy: RetryPolicy | None
+        Decides how failed requests are retried. Defaults to :class:`RetryPolicy` with its defaults.
+    cache: ResponseCache | None
+        Caches the responses of read endpoints. Nothing is cached if not provided.
+    scheduler: Scheduler | None
+        Orders requests by priority. Defaults to :class:`Scheduler` with its defaults.
+    concurrency: AdaptiveLimit | None
+        Adapts the slots the scheduler shares between requests other than callbacks.
+        Defaults to :class:`AdaptiveLimit` starting from the total of the scheduler.
+    breaker: CircuitBreaker | None
+        Stops sending requests while discord is failing. Defaults to :class:`CircuitBreaker`
+        with its defaults.
+    edits: EditCoalescer | None
+        Merges frequent edits of the same message. Every edit is sent if not provided.
+    codec: JSONCodec | None
+        Encodes request bodies and decodes responses. Defaults to the codec of the process.
+    """
+
+    BASE_URL: str = "https://discord.com"
     DISCORD_API_VERSION: int = 10
 
-    def __init__(self, client: "Client", token: str):
+    def __init__(
+        self,
+        client: "Client",
+        token: str,
+        *,
+        connector_options: Optional[Dict[str, Any]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[Scheduler] = None,
+        concurrency: Optional[AdaptiveLimit] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        edits: Optional["EditCoalescer"] = None,
+        codec: Optional[JSONCodec] = None,
+    ):
         self.token = token
         self.client = client
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.connector_options = {**CONNECTOR_DEFAULTS, **(connector_options or {})}
+        # some serverless platforms run every request on a new event loop,
+        # a session can only be used on the loop it was created on
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._downloads: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self.ratelimiter = RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.scheduler = scheduler or Scheduler()
+        self.concurrency = concurrency or AdaptiveLimit(
+            self.scheduler.total or self.connector_options["limit"]
+        )
+        self.scheduler.resize(int(self.concurrency.limit))
+        self.breaker = breaker or CircuitBreaker()
+        self.edits = edits
+        self.codec = codec or get_codec()
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        """
+        The session of the running event loop, if one was opened.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        return self._sessions.get(loop)
+
+    @session.setter
+    def session(self, session: Optional[aiohttp.ClientSession]):
+        loop = asyncio.get_running_loop()
+        if session is None:
+            self._sessions.pop(loop, None)
+        else:
+            self._sessions[loop] = session
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the session of the running event loop, opening one if needed.
+        The session is reused for as long as the loop is unchanged.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            self.prune_sessions()
+            session = self._sessions[loop] = self.create_session()
+        return session
+
+    def prune_sessions(self) -> int:
+        """
+        Drops the sessions of event loops that have been closed.
+
+        Returns
+        -------
+        int
+            The number of sessions dropped.
+        """
+        dropped = 0
+        for sessions in (self._sessions, self._downloads):
+            dead = [loop for loop in sessions if loop.is_closed()]
+            for loop in dead:
+                # the connections died with the loop, the session can not be closed anymore
+                sessions.pop(loop).detach()
+            dropped += len(dead)
+        return dropped
+
+    def create_session(self) -> aiohttp.ClientSession:
+        """
+        Creates a session to discord with a connector tuned by the connector options.
+        """
+        return aiohttp.ClientSession(
+            self.BASE_URL,
+            connector=aiohttp.TCPConnector(**self.connector_options),
+        )
+
+    def get_download_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the session attachments are downloaded with on the running event loop,
+        opening one if needed.
+
+        Its connections are separate from those of :meth:`get_session` and capped by
+        :data:`DOWNLOAD_CONNECTOR_DEFAULTS`, so downloads can not starve requests to discord.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._downloads.get(loop)
+        if session is None or session.closed:
+            self.prune_sessions()
+            session = self._downloads[loop] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**DOWNLOAD_CONNECTOR_DEFAULTS)
+            )
+        return session
+
+    async def start(self):
+        """
+        Opens the session and a connection to discord ahead of the first request.
+        Called when the application starts.
+        """
+        session = self.get_session()
+        try:
+            # an unauthenticated endpoint, this only pays for dns, tcp and tls up front
+            async with session.get(
+                f"/api/v{self.DISCORD_API_VERSION}/gateway",
+                timeout=aiohttp.ClientTimeout(total=WARM_UP_TIMEOUT),
+            ) as resp:
+                await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+
+    async def close(self):
+        """
+        Closes the sessions of the running event loop and drops the sessions of closed loops.
+        Called when the application shuts down, after the pending edits are sent.
+        """
+        if self.edits is not None:
+            await self.edits.flush()
+        loop = asyncio.get_running_loop()
+        for session in (
+            self._sessions.pop(loop, None),
+            self._downloads.pop(loop, None),
+        ):
+            if session:
+                await session.close()
+        self.prune_sessions()
 
     async def request(
         self,
@@ -26,6 +339,73 @@ class HTTPClient:
         headers: Optional[Dict[str, Any]] = None,
         reason: Optional[str] = None,
         json: Any = None,
+        data: Optional[bytes] = None,
+        form: aiohttp.MultipartWriter = None,
+        params: Optional[Dict[str, Any]] = None,
+        authorize: bool = False,
+    ):
+        if method != "GET" or headers:
+            resp = await self._request(
+                method,
+                path,
+                headers=headers,
+                reason=reason,
+                json=json,
+                data=data,
+                form=form,
+                params=params,
+                authorize=authorize,
+            )
+            if self.cache is not None and method != "GET":
+                self.cache.invalidate(path)
+            return resp
+        key = (path, tuple(sorted((params or {}).items())), authorize)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached:
+                return cached
+        # identical GETs in flight share one upstream request and its response,
+        # it runs in its own task so a caller being cancelled does not fail the others
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get((loop, *key))
+        if not task:
+            task = self._inflight[(loop, *key)] = loop.create_task(
+                self._read_request(key, params)
+            )
+            task.add_done_callback(partial(self._settle, (loop, *key)))
+        return await asyncio.shield(task)
+
+    def _settle(self, key: Tuple[Any, ...], task: asyncio.Task):
+        del self._inflight[key]
+        if not task.cancelled():
+            # mark the exception as retrieved in case every caller was cancelled
+            task.exception()
+
+    async def _read_request(
+        self, key: CacheKey, params: Optional[Dict[str, Any]]
+    ) -> HTTPResponse:
+        path, _, authorize = key
+        # the task copied the context of the first caller, the request is shared by every
+        # caller and must not run at its priority or stop with its interaction
+        request_priority.set(None)
+        interaction_deadline.set(None)
+        generation = self.cache.generation if self.cache is not None else 0
+        resp = await self._request("GET", path, params=params, authorize=authorize)
+        if self.cache is not None and self.cache.generation == generation:
+            ttl = self.cache.ttl_for(path)
+            if ttl is not None:
+                self.cache.set(key, resp, ttl=ttl)
+        return resp
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Optional[Dict[str, Any]] = None,
+        reason: Optional[str] = None,
+        json: Any = None,
+        data: Optional[bytes] = None,
         form: aiohttp.MultipartWriter = None,
         params: Optional[Dict[str, Any]] = None,
         authorize: bool = False,
@@ -40,19 +420,119 @@ class HTTPClient:
         if form:
             for key, value in headers.items():
                 form.headers.add(key, value)
-        if not self.session:
-            self.session = aiohttp.ClientSession("https://discord.com")
-        resp = await self.session.request(
-            method,
-            f"/api/v{self.DISCORD_API_VERSION}{path}",
-            params=params,
-            headers=form.headers if form else headers,
-            data=form,
-            json=json,
-        )
-        if resp.status >= 400:
-            raise HTTPException(resp, await resp.json())
-        return resp
+        if form:
+            data = form
+        elif json is not None:
+            data = self.codec.dumps(json)
+        session = self.get_session()
+        policy = self.retry_policy
+        deadline = policy.deadline_for(path, time.time())
+        attempts = retries = 0
+        level = self.scheduler.classify(path)
+        while True:
+            probe = False
+            try:
+                # the slot is held while waiting for the rate limit but not during backoff
+                async with self.scheduler.slot(level, deadline):
+                    # checked once the slot is granted, discord may have failed meanwhile.
+                    # callbacks have seconds to be sent and are never held back by failures
+                    # of other routes
+                    if level != Priority.callback:
+                        probe = await self.breaker.acquire(deadline)
+                    route, major = await self.ratelimiter.acquire(
+                        method, path, authorized=authorize
+                    )
+                    # the attempt is timed from here, queueing for a slot or a bucket
+                    # only counts against the deadline of retries
+                    timeout = policy.timeout(upload=form is not None)
+                    error = None
+                    sent_at = time.monotonic()
+                    try:
+                        resp = await session.request(
+                            method,
+                            f"/api/v{self.DISCORD_API_VERSION}{path}",
+                            params=params,
+                            headers=form.headers if form else headers,
+                            data=data,
+                            **({"timeout": timeout} if timeout else {}),
+                        )
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        self.ratelimiter.release(route, major)
+                        error = e
+                    except BaseException:
+                        self.ratelimiter.release(route, major)
+                        raise
+            except BaseException:
+                if probe:
+                    # the probe ended without telling whether discord recovered
+                    self.breaker.release()
+                raise
+            if error is not None:
+                self._record(level, None, None)
+                delay = policy.retry_after(method, retries, error, deadline)
+                if delay is None or _consumed(form):
+                    raise error
+                retries += 1
+                await asyncio.sleep(delay)
+                continue
+            # uploads are slow because of their size, not because discord is
+            self._record(
+                level, resp.status, None if form else time.monotonic() - sent_at
+            )
+            policy.sent()
+            self.ratelimiter.update(route, major, resp.headers)
+            if (
+                resp.status == 429
+                and attempts < self.ratelimiter.max_retries
+                and not _consumed(form)
+            ):
+                # the next acquire waits for the bucket or the global limit to reset
+                self.ratelimiter.rate_limited(
+                    route, major, resp.headers, await _read(resp, self.codec)
+                )
+                attempts += 1
+                continue
+            if resp.status >= 500:
+                hint = resp.headers.get("Retry-After")
+                delay = policy.retry_after(
+                    method,
+                    retries,
+                    resp.status,
+                    deadline,
+                    hint=float(hint) if hint else None,
+                )
+                if delay is not None and not _consumed(form):
+                    # read so the connection goes back to the pool instead of being closed
+                    await resp.read()
+                    retries += 1
+                    await asyncio.sleep(delay)
+                    continue
+            break
+        try:
+            result = HTTPResponse(resp, await resp.read(), self.codec)
+        finally:
+            resp.release()
+        if not result.ok:
+            raise HTTPException(result, result.data)
+        return result
+
+    def _record(self, level: Priority, status: Optional[int], latency: Optional[float]):
+        # connection errors, timeouts and 5xx are failures, a 429 only asks for less traffic
+        failed = status is None or status >= 500
+        if level != Priority.callback:
+            self.breaker.record(not failed)
+        self.scheduler.resize(self.concurrency.record(failed or status == 429, latency))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the state of the scheduler, the adaptive concurrency limit and the circuit breaker,
+        for export to metrics.
+        """
+        return {
+            "scheduler": self.scheduler.stats(),
+            "concurrency": self.concurrency.stats(),
+            "breaker": self.breaker.stats(),
+        }
 
     async def fetch_application(self):
         return await self.request("GET", "/applications/@me", authorize=True)
@@ -100,9 +580,9 @@ class HTTPClient:
             authorize=True,
         )
 
-    async def send_message(self, channel_id: str, form: aiohttp.MultipartWriter):
+    async def send_message(self, channel_id: str, payload: Body):
         return await self.request(
-            "POST", f"/channels/{channel_id}/messages", form=form, authorize=True
+            "POST", f"/channels/{channel_id}/messages", **_body(payload), authorize=True
         )
 
     async def create_dm_channel(self, payload: Dict[str, Any]):
@@ -151,21 +631,26 @@ class HTTPClient:
             authorize=True,
         )
 
+    async def _edit(self, path: str, payload: Body, *, authorize: bool = False):
+        async def send(body: Body) -> HTTPResponse:
+            return await self.request("PATCH", path, **_body(body), authorize=authorize)
+
+        if self.edits is None:
+            return await send(payload)
+        return await self.edits.submit(path, payload, send)
+
     async def edit_channel_message(
-        self, channel_id: str, message_id: str, form: aiohttp.MultipartWriter
+        self, channel_id: str, message_id: str, payload: Body
     ):
-        return await self.request(
-            "PATCH",
-            f"/channels/{channel_id}/messages/{message_id}",
-            form=form,
-            authorize=True,
+        return await self._edit(
+            f"/channels/{channel_id}/messages/{message_id}", payload, authorize=True
         )
 
     async def send_webhook_message(
-        self, webhook_id: str, webhook_token: str, form: aiohttp.MultipartWriter
+        self, webhook_id: str, webhook_token: str, payload: Body
     ):
         return await self.request(
-            "POST", f"/webhooks/{webhook_id}/{webhook_token}", form=form
+            "POST", f"/webhooks/{webhook_id}/{webhook_token}", **_body(payload)
         )
 
     async def delete_webhook_message(
@@ -180,12 +665,10 @@ class HTTPClient:
         webhook_id: str,
         webhook_token: str,
         message_id: str,
-        form: aiohttp.MultipartWriter,
+        payload: Body,
     ):
-        return await self.request(
-            "PATCH",
-            f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}",
-            form=form,
+        return await self._edit(
+            f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}", payload
         )
 
     async def fetch_original_webhook_message(self, webhook_id: str, webhook_token: str):
@@ -315,11 +798,14 @@ class HTTPClient:
         self,
         webhook_id: str,
         webhook_token: str,
-        form: aiohttp.MultipartWriter,
+        payload: Body,
         params: Dict[str, Any],
     ):
         return await self.request(
-            "POST", f"/webhooks/{webhook_id}/{webhook_token}", form=form, params=params
+            "POST",
+            f"/webhooks/{webhook_id}/{webhook_token}",
+            **_body(payload),
+            params=params,
         )
 
     async def edit_webhook(self, webhook_id: str, payload: Dict[str, Any]):
@@ -1,6 +1,8 @@
+import asyncio
 from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from .adapter import ResponseAdapter
+from .attachment import Attachment
 from .channel import PartialChannel
 from .enums import InteractionContextType, InteractionType, try_enum
 from .guild import PartialGuild
@@ -58,6 +60,11 @@ class Interaction:
         self.client: "Client" = client
         self._parsed_options = None
         self.focused_option_name: Optional[str] = None
+        self._inline: Optional[asyncio.Future] = None
+        self._inline_sent: Optional[asyncio.Event] = None
+        self._auto_deferred: Optional[asyncio.Task] = None
+        self._deferred_ephemeral = False
+        self._attachments: Optional[Dict[str, Attachment]] = None
 
     @property
     def data(self) -> Dict[str, Any]:
@@ -77,6 +84,35 @@ class Interaction:
         """
         return self._parsed_options
 
+    @property
+    def attachments(self) -> Dict[str, Attachment]:
+        """
+        The attachments resolved for the options of the interaction, by id
+
+        Returns
+        -------
+        Dict[str, Attachment]
+        """
+        if self._attachments is None:
+            resolved = self.data.get("resolved", {}).get("attachments", {})
+            self._attachments = {
+                attachment_id: Attachment(self.client, payload)
+                for attachment_id, payload in resolved.items()
+            }
+        return self._attachments
+
+    def prefetch_attachments(self, *, max_size: Optional[int] = None):
+        """
+        Starts downloading every attachment of the interaction concurrently.
+
+        Parameters
+        ----------
+        max_size: Optional[int]
+            The size in bytes above which an attachment is not prefetched
+        """
+        for attachment in self.attachments.values():
+            attachment.prefetch(max_size=max_size)
+
     @property
     def responded(self) -> bool:
         """
@@ -1,11 +1,10 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-import aiohttp
-
 from .attachment import Attachment
 from .embed import Embed
 from .emoji import PartialEmoji
 from .file import File
+from .https import HTTPResponse
 from .models import AllowedMentions, MessageReference
 from .params import MISSING, _EditingPayload, _SendingPayload
 from .poll import Poll
@@ -149,7 +148,7 @@ class Message:
         attachments = self.data.get("attachments")
         if not attachments:
             return
-        return [Attachment(x) for x in attachments]
+        return [Attachment(self.client, x) for x in attachments]
 
     @property
     def poll(self) -> Optional[Poll]:
@@ -285,7 +284,7 @@ class Message:
         if view and view is not MISSING:
             self.client.load_view(view)
         resp = await self.client.http.edit_channel_message(
-            self.channel_id, self.id, payload.to_form()
+            self.channel_id, self.id, payload.to_body()
         )
         return Message(self.client, await resp.json())
 
@@ -365,7 +364,7 @@ class Message:
         )
         if view and view is not MISSING:
             self.client.load_view(view)
-        resp = await self.client.http.send_message(self.channel_id, payload.to_form())
+        resp = await self.client.http.send_message(self.channel_id, payload.to_body())
         return Message(self.client, await resp.json())
 
     async def add_reaction(self, emoji: Union[PartialEmoji, str]):
@@ -442,7 +441,7 @@ class Message:
         auto_archive_duration: int = 60,
         rate_limit_per_user: int = 0,
         reason: Optional[str] = None,
-    ) -> aiohttp.ClientResponse:
+    ) -> HTTPResponse:
         """
         Starts a thread from the message.
 
@@ -459,7 +458,7 @@ class Message:
 
         Returns
         -------
-        aiohttp.ClientResponse
+        HTTPResponse
         """
         payload = {
             "name": name,
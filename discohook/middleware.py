@@ -1,18 +1,20 @@
-import aiohttp
-from starlette.middleware.base import (BaseHTTPMiddleware,
-                                       RequestResponseEndpoint)
-from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class SingleUseSession(BaseHTTPMiddleware):
+class SingleUseSession:
     """
-    This middleware creates a new aiohttp.ClientSession to handle this request.
+    This middleware releases the sessions of event loops that have been closed.
     This is helpful for some serverless providers
     that handle each request in a new event loop but keep the same app instance.
+
+    The HTTP client keeps one session per event loop, so connections are reused
+    for as long as the provider keeps the loop alive.
     """
 
-    async def dispatch(self, request: Request, rre: RequestResponseEndpoint):
-        if request.app.http.session:
-            await request.app.http.session.close()
-        request.app.http.session = aiohttp.ClientSession("https://discord.com")
-        return await rre(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            scope["app"].http.prune_sessions()
+        await self.app(scope, receive, send)
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from .base import Component
 from .enums import ComponentType, TextInputFieldLength
+from .utils import Binder, make_binder
 
 if TYPE_CHECKING:
     from .interaction import Interaction
@@ -83,14 +84,43 @@ class Modal(Component):
         The title of the modal.
     custom_id: :class:`str`
         The unique id of the modal.
+    auto_defer: Optional[:class:`float`]
+        Seconds after the submission was created at which it is deferred automatically.
+    background: :class:`bool`
+        Whether to acknowledge the interaction immediately and run the callback in the background.
+    timeout: Optional[:class:`float`]
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
     """
 
-    def __init__(self, title: str, *, custom_id: Optional[str] = None):
-        super().__init__(custom_id=custom_id)
+    def __init__(
+        self,
+        title: str,
+        *,
+        custom_id: Optional[str] = None,
+        auto_defer: Optional[float] = None,
+        background: bool = False,
+        timeout: Optional[float] = None,
+    ):
+        super().__init__(
+            custom_id=custom_id,
+            auto_defer=auto_defer,
+            background=background,
+            timeout=timeout,
+        )
         self.title = title
         # self.components: List[Component] = []
         self.rows: List[Dict[str, Any]] = []
 
+    @property
+    def callback(self) -> Optional[Callable[["Interaction", Any], Any]]:
+        return self._callback
+
+    @callback.setter
+    def callback(self, coro: Optional[Callable[["Interaction", Any], Any]]):
+        self._callback = coro
+        self._binder: Binder = make_binder(coro)
+
     def add_field(
         self,
         label: str,
@@ -160,6 +190,9 @@ def new(
     *,
     fields: List[TextInput],
     custom_id: Optional[str] = None,
+    auto_defer: Optional[float] = None,
+    background: bool = False,
+    timeout: Optional[float] = None,
 ):
     """
     A decorator that creates a modal and registers a callback.
@@ -172,6 +205,13 @@ def new(
         The fields to be added to the modal.
     custom_id: Optional[str]
         The custom id of the modal. If not provided, it will be generated automatically.
+    auto_defer: Optional[float]
+        Seconds after the submission was created at which it is deferred automatically.
+    background: bool
+        Whether to acknowledge the interaction immediately and run the callback in the background.
+    timeout: Optional[float]
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
 
     Returns
     -------
@@ -186,7 +226,13 @@ def new(
     def decorator(coro: Callable[["Interaction", Any], Any]):
         if not asyncio.iscoroutinefunction(coro):
             raise TypeError("Callback must be a coroutine.")
-        self = Modal(title, custom_id=custom_id)
+        self = Modal(
+            title,
+            custom_id=custom_id,
+            auto_defer=auto_defer,
+            background=background,
+            timeout=timeout,
+        )
         for field in fields:
             self.rows.append(field.to_dict())
         self.callback = coro
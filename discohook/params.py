@@ -1,10 +1,10 @@
-import json
 import mimetypes
 from enum import Enum, IntEnum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
 
 import aiohttp
 
+from . import codec
 from .embed import Embed
 from .file import File
 from .models import AllowedMentions, MessageReference
@@ -69,7 +69,7 @@ class _SendingPayload:
         form = aiohttp.MultipartWriter("form-data")
         # noinspection PyTypeChecker
         form.append(
-            json.dumps(payload),
+            codec.dumps(payload),
             headers={
                 "Content-Disposition": 'form-data; name="payload_json"',
                 "Content-Type": "application/json",
@@ -79,13 +79,13 @@ class _SendingPayload:
             files = []
         for i, file in enumerate(files):
             mime, _ = mimetypes.guess_type(file.name)
-            # noinspection PyTypeChecker
-            form.append(
-                file.content,
-                headers={
-                    "Content-Disposition": f'form-data; name="files[{i}]"; filename="{file.name}"',
-                    "Content-Type": mime or "application/octet-stream",
-                },
+            form.append_payload(
+                file.to_payload(
+                    {
+                        "Content-Disposition": f'form-data; name="files[{i}]"; filename="{file.name}"',
+                        "Content-Type": mime or "application/octet-stream",
+                    }
+                )
             )
         return form
 
@@ -141,6 +141,15 @@ class _SendingPayload:
     ) -> aiohttp.MultipartWriter:
         return self._create_form(self.to_dict(payload_type, **kwargs), self.files)
 
+    def to_body(
+            self, payload_type: Optional[Enum] = None, **kwargs
+    ) -> Union[Dict[str, Any], aiohttp.MultipartWriter]:
+        # a plain json body unless there are files to upload
+        data = self.to_dict(payload_type, **kwargs)
+        if not self.files:
+            return data
+        return self._create_form(data, self.files)
+
 
 class _EditingPayload(_SendingPayload):
     def __init__(
@@ -154,6 +163,8 @@ class _EditingPayload(_SendingPayload):
             file: Optional[File] = MISSING,
             files: Optional[List[File]] = MISSING,
             suppress_embeds: Optional[bool] = MISSING,
+            allowed_mentions: Optional[AllowedMentions] = MISSING,
+            poll: Optional["Poll"] = MISSING,
     ):
         super().__init__(
             content=content,
@@ -164,6 +175,8 @@ class _EditingPayload(_SendingPayload):
             file=file,
             files=files,
             suppress_embeds=suppress_embeds,
+            allowed_mentions=allowed_mentions,
+            poll=poll,
         )
 
     def _handle_edit_params(self):
@@ -199,6 +212,10 @@ class _EditingPayload(_SendingPayload):
             ]
         if self.suppress_embeds is not MISSING:
             payload["flags"] = 1 << 2
+        if self.allowed_mentions and self.allowed_mentions is not MISSING:
+            payload["allowed_mentions"] = self.allowed_mentions.to_dict()
+        if self.poll and self.poll is not MISSING:
+            payload["poll"] = self.poll.to_dict()
 
         return payload
 
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from .errors import WorkerPoolFull
+
+
+class WorkerPool:
+    """
+    A bounded pool of workers that runs interaction callbacks in the background.
+
+    Parameters
+    ----------
+    workers: int
+        The number of callbacks that may run at the same time.
+    queue_size: int
+        The number of callbacks that may wait for a free worker.
+        Submitting beyond this raises :class:`WorkerPoolFull`.
+    """
+
+    def __init__(self, workers: int = 16, queue_size: int = 256):
+        self.workers = workers
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._busy = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _start(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = {asyncio.create_task(self._work()) for _ in range(self.workers)}
+
+    async def _work(self):
+        queue = self._queue
+        while True:
+            queued_at, func, args = await queue.get()
+            waited = time.perf_counter() - queued_at
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            self._busy += 1
+            try:
+                await func(*args)
+            except Exception as e:
+                self._failed += 1
+                self._loop.call_exception_handler(
+                    {
+                        "message": "Unhandled exception in background callback",
+                        "exception": e,
+                    }
+                )
+            else:
+                self._completed += 1
+            finally:
+                self._busy -= 1
+                queue.task_done()
+
+    def submit(self, func: Callable[..., Awaitable[Any]], *args: Any):
+        """
+        Queues a coroutine function to be called with the arguments by the next free worker.
+        The coroutine is only created once a worker picks it up, a rejected callback never starts.
+
+        Raises
+        ------
+        WorkerPoolFull
+            If the queue is already at its limit.
+        """
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            self._start()
+        try:
+            self._queue.put_nowait((time.perf_counter(), func, args))
+        except asyncio.QueueFull:
+            self._rejected += 1
+            raise WorkerPoolFull(
+                f"worker pool is full ({self.queue_size} callbacks waiting)"
+            ) from None
+        self._submitted += 1
+
+    async def close(self):
+        """
+        Waits for the queued callbacks to finish and stops the workers.
+        Called when the application shuts down.
+        """
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            # the workers of another event loop can not be awaited from this one
+            return
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._queue = None
+        self._tasks = set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the current state of the pool.
+
+        Returns
+        -------
+        Dict[str, Any]
+            queue depth, busy workers, counters and wait times in seconds.
+        """
+        started = self._submitted - (self._queue.qsize() if self._queue else 0)
+        return {
+            "workers": self.workers,
+            "busy": self._busy,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "queue_size": self.queue_size,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "average_wait": self._total_wait / started if started > 0 else 0.0,
+            "max_wait": self._max_wait,
+        }
@@ -0,0 +1,249 @@
+import asyncio
+import re
+import time
+from collections import deque
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# the first id after these resources is a major parameter, webhooks and interactions
+# are additionally keyed by their token
+_MAJOR = re.compile(r"^/(channels|guilds|webhooks|interactions)/(\d+)(?:/([^/]+))?")
+_ID = re.compile(r"/\d{15,21}(?=/|$)")
+_REACTION = re.compile(r"/reactions/[^/]+")
+# reset times of responses from the same window differ by network latency
+_JITTER = 0.1
+
+Route = Tuple[str, str]
+Major = Tuple[str, ...]
+
+
+def parse_route(method: str, path: str) -> Tuple[Route, Major]:
+    path = path.split("?", 1)[0]
+    major: Major = ()
+    template = path
+    match = _MAJOR.match(path)
+    if match:
+        resource, major_id, token = match.groups()
+        if resource in ("webhooks", "interactions") and token and not token.isdigit():
+            major = (resource, major_id, token)
+            template = f"/{resource}/{{id}}/{{token}}{path[match.end():]}"
+        else:
+            major = (resource, major_id)
+    template = _REACTION.sub("/reactions/{emoji}", _ID.sub("/{id}", template))
+    return (method, template), major
+
+
+class Bucket:
+    """
+    The state of a single rate limit bucket, as last reported by discord.
+    """
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.reset_after = 1.0
+        self._known = False
+        self._discovery: Optional[asyncio.Future] = None
+        self._waiters = 0
+
+    def idle(self, now: float) -> bool:
+        """
+        Whether the window of the bucket has passed and no request is waiting on it,
+        forgetting it then only costs a request to discover its limits again.
+        """
+        discovering = self._discovery is not None and not self._discovery.done()
+        return not self._waiters and not discovering and self.reset_at <= now
+
+    async def acquire(self):
+        self._waiters += 1
+        try:
+            await self._wait()
+        finally:
+            self._waiters -= 1
+
+    async def _wait(self):
+        while True:
+            if not self._known:
+                # only one request goes out until discord reports the limits of the bucket
+                loop = asyncio.get_running_loop()
+                discovery = self._discovery
+                if discovery and not discovery.done() and discovery.get_loop() is loop:
+                    await discovery
+                    continue
+                self._discovery = loop.create_future()
+                return
+            now = time.monotonic()
+            if self.reset_at <= now:
+                # assume the next window is as long as the last one until discord reports it,
+                # it only starts once our first request arrives
+                self.remaining = self.limit
+                self.reset_at = now + self.reset_after + _JITTER
+            if self.remaining is None or self.remaining > 0:
+                if self.remaining is not None:
+                    self.remaining -= 1
+                return
+            await asyncio.sleep(self.reset_at - now)
+
+    def release(self):
+        if self._discovery and not self._discovery.done():
+            self._discovery.set_result(None)
+
+    def update(self, headers: Mapping[str, str]):
+        self._known = True
+        self.release()
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if limit is None or remaining is None or reset_after is None:
+            return
+        reset_at = time.monotonic() + float(reset_after)
+        if self.remaining is not None and reset_at < self.reset_at + _JITTER:
+            # responses of the same window arrive out of order, never hand out more than is left
+            self.remaining = min(self.remaining, int(remaining))
+        else:
+            self.remaining = int(remaining)
+            self.reset_at = reset_at
+            self.reset_after = float(reset_after)
+        self.limit = int(limit)
+
+    def exhaust(self, retry_after: float):
+        self.remaining = 0
+        self.reset_at = time.monotonic() + retry_after
+
+
+class RateLimiter:
+    """
+    Paces requests to discord according to the rate limits it reports.
+
+    Routes are mapped to the bucket discord reports in ``X-RateLimit-Bucket``
+    and every bucket is tracked separately for each major parameter
+    (channel, guild, webhook or interaction token). Requests authorized with the bot token
+    are additionally held to the global limit.
+    Buckets whose window has passed are forgotten, most major parameters such as interaction
+    tokens are only used for a few requests.
+
+    Parameters
+    ----------
+    global_limit: int
+        The number of authorized requests allowed per second. Defaults to 50.
+    max_retries: int
+        How many times a request is retried after it was rate limited. Defaults to 3.
+    """
+
+    def __init__(self, global_limit: int = 50, max_retries: int = 3):
+        self.global_limit = global_limit
+        self.max_retries = max_retries
+        self._hashes: Dict[Route, str] = {}
+        self._buckets: Dict[Tuple[str, Major], Bucket] = {}
+        self._next_sweep = 64
+        self._global_reset_at = 0.0
+        # the times of the latest authorized requests, a sliding window keeps bursts
+        # across the edge of a fixed window from reaching twice the limit
+        self._sent: "deque[float]" = deque(maxlen=global_limit)
+
+    def _bucket(self, route: Route, major: Major) -> Bucket:
+        # routes are their own bucket until discord tells which bucket they share
+        key = (self._hashes.get(route) or " ".join(route), major)
+        bucket = self._buckets.get(key)
+        if not bucket:
+            bucket = self._buckets[key] = Bucket()
+        return bucket
+
+    def sweep(self) -> int:
+        """
+        Forgets the buckets that are idle.
+
+        Returns
+        -------
+        int
+            The number of buckets forgotten.
+        """
+        now = time.monotonic()
+        idle = [key for key, bucket in self._buckets.items() if bucket.idle(now)]
+        for key in idle:
+            del self._buckets[key]
+        return len(idle)
+
+    async def _acquire_global(self):
+        while True:
+            now = time.monotonic()
+            if self._global_reset_at > now:
+                await asyncio.sleep(self._global_reset_at - now)
+                continue
+            # requests sent a second apart may arrive closer together
+            window = 1 + _JITTER
+            if len(self._sent) < self.global_limit or now - self._sent[0] >= window:
+                self._sent.append(now)
+                return
+            await asyncio.sleep(self._sent[0] + window - now)
+
+    async def acquire(
+        self, method: str, path: str, *, authorized: bool = True
+    ) -> Tuple[Route, Major]:
+        """
+        Waits until a request to the path can be made without being rate limited.
+
+        Returns
+        -------
+        Tuple[Route, Major]
+            The route and major parameters to pass to :meth:`update`.
+        """
+        route, major = parse_route(method, path)
+        if len(self._buckets) >= self._next_sweep:
+            # amortised so buckets of tokens that are never used again do not pile up
+            self.sweep()
+            self._next_sweep = max(64, len(self._buckets) * 2)
+        if authorized:
+            await self._acquire_global()
+        else:
+            now = time.monotonic()
+            if self._global_reset_at > now:
+                await asyncio.sleep(self._global_reset_at - now)
+        await self._bucket(route, major).acquire()
+        return route, major
+
+    def update(self, route: Route, major: Major, headers: Mapping[str, str]):
+        """
+        Records the rate limit headers of a response.
+        """
+        previous = self._bucket(route, major)
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if bucket_hash and self._hashes.get(route) != bucket_hash:
+            self._hashes[route] = bucket_hash
+            self._buckets.setdefault((bucket_hash, major), previous)
+        bucket = self._bucket(route, major)
+        bucket.update(headers)
+        if previous is not bucket:
+            previous.update(headers)
+
+    def release(self, route: Route, major: Major):
+        """
+        Lets the next request through after a request failed without a response.
+        """
+        self._bucket(route, major).release()
+
+    def rate_limited(
+        self,
+        route: Route,
+        major: Major,
+        headers: Mapping[str, str],
+        data: Any,
+    ) -> float:
+        """
+        Records a 429 response and returns the seconds to wait before retrying.
+        """
+        data = data if isinstance(data, dict) else {}
+        retry_after = float(data.get("retry_after") or headers.get("Retry-After") or 1)
+        # cloudflare bans come without a body and bucket headers, treat them as global
+        if (
+            data.get("global")
+            or headers.get("X-RateLimit-Global")
+            or headers.get("X-RateLimit-Scope") == "global"
+            or not data
+        ):
+            self._global_reset_at = max(
+                self._global_reset_at, time.monotonic() + retry_after
+            )
+        else:
+            self._bucket(route, major).exhaust(retry_after)
+        return retry_after
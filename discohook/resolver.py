@@ -1,7 +1,5 @@
-import inspect
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from .attachment import Attachment
 from .channel import Channel
 from .enums import ApplicationCommandOptionType, ApplicationCommandType, ComponentType
 from .interaction import Interaction
@@ -9,7 +7,7 @@ from .member import Member
 from .message import Message
 from .role import Role
 from .user import User
-from .utils import unwrap_user
+from .utils import make_binder, unwrap_user
 
 
 def handle_params_by_signature(
@@ -17,32 +15,7 @@ def handle_params_by_signature(
     options: Dict[str, Any],
     skips: int = 1,
 ) -> Tuple[List[Any], Dict[str, Any]]:
-    if not func:
-        return [], {}
-    params = inspect.getfullargspec(func)
-    default_args = params.defaults or []
-    default_kwargs = params.kwonlydefaults or {}
-
-    args = []
-    positional_args = [
-        None for _ in range(len(params.args[skips:]) - len(default_args))
-    ]
-    positional_args.extend(default_args)
-    for param, default in zip(params.args[skips:], positional_args):
-        option = options.get(param)
-        if option is not None:
-            args.append(option)
-        else:
-            args.append(default)
-
-    kwargs = {}
-    for kw in params.kwonlyargs:
-        option = options.get(kw)
-        if option is not None:
-            kwargs[kw] = option
-        else:
-            kwargs[kw] = default_kwargs.get(kw)
-    return args, kwargs
+    return make_binder(func, skips)(options)
 
 
 def parse_generic_options(payload: List[Dict[str, Any]], interaction: Interaction):
@@ -92,24 +65,27 @@ def parse_generic_options(payload: List[Dict[str, Any]], interaction: Interactio
                     interaction.client, interaction.data["resolved"]["roles"].get(value)
                 )
         elif option_type == ApplicationCommandOptionType.attachment:
-            options[name] = Attachment(
-                interaction.data["resolved"]["attachments"][value]
-            )
+            options[name] = interaction.attachments[value]
     interaction._parsed_options = options
     return options
 
 
-def build_slash_command_params(
-    func: Callable, interaction: Interaction, skips: int = 1
-):
+def parse_slash_command_options(interaction: Interaction) -> Optional[Dict[str, Any]]:
     command_options = interaction.data.get("options")
     if not command_options:
-        return [], {}
+        return
     if command_options[0]["type"] == ApplicationCommandOptionType.subcommand:
         subcommand_options = command_options[0].get("options") or []
-        parsed = parse_generic_options(subcommand_options, interaction)
-    else:
-        parsed = parse_generic_options(interaction.data["options"], interaction)
+        return parse_generic_options(subcommand_options, interaction)
+    return parse_generic_options(command_options, interaction)
+
+
+def build_slash_command_params(
+    func: Callable, interaction: Interaction, skips: int = 1
+):
+    parsed = parse_slash_command_options(interaction)
+    if parsed is None:
+        return [], {}
     return handle_params_by_signature(func, parsed, skips)
 
 
@@ -132,13 +108,17 @@ def build_context_menu_param(interaction: Interaction):
         return Message(interaction.client, message)
 
 
-def build_modal_params(func: Callable, interaction: Interaction):
+def parse_modal_options(interaction: Interaction) -> Dict[str, Any]:
     options = {}
     for row in interaction.data["components"]:
         comp = row["components"][0]
         if comp["type"] == 4:
             options[comp["custom_id"]] = comp["value"]
-    return handle_params_by_signature(func, options)
+    return options
+
+
+def build_modal_params(func: Callable, interaction: Interaction):
+    return handle_params_by_signature(func, parse_modal_options(interaction))
 
 
 def build_select_menu_values(interaction: Interaction) -> List[Any]:
@@ -0,0 +1,155 @@
+import asyncio
+import contextvars
+import random
+import re
+import time
+from typing import Optional, Union
+
+import aiohttp
+
+from .utils import snowflake_time
+
+# interactions have to be answered within 3 seconds, their token lives for 15 minutes
+CALLBACK_WINDOW = 3.0
+TOKEN_LIFETIME = 15 * 60.0
+
+#: The wall clock time by which the interaction being handled can no longer be acted upon.
+interaction_deadline: "contextvars.ContextVar[Optional[float]]" = (
+    contextvars.ContextVar("interaction_deadline", default=None)
+)
+
+_CALLBACK = re.compile(r"^/interactions/(\d+)/[^/]+/callback")
+_IDEMPOTENT = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request to discord is sent again.
+
+    Idempotent methods (GET, HEAD, OPTIONS, PUT, DELETE) are retried on 5xx responses,
+    connection errors and timeouts. POST and PATCH are only retried when the connection
+    could not be established, as discord may otherwise have acted on them already.
+
+    Parameters
+    ----------
+    retries: int
+        The maximum number of retries of a single request. Defaults to 3.
+    backoff: float
+        The base delay in seconds, doubled on every retry and fully jittered. Defaults to 0.5.
+    max_backoff: float
+        The upper bound of a single delay in seconds. Defaults to 8.
+    deadline: float | None
+        Seconds after which a failed request is not retried anymore, and the timeout of every
+        attempt from when it is sent. Defaults to 30. Time spent waiting for a scheduler slot
+        or a rate limit does not count against an attempt.
+        Requests made while handling an interaction also stop being retried when its token
+        expires, and interaction callbacks when the 3 seconds to answer have passed.
+    budget: float
+        The number of retries that may be spent in a burst. Defaults to 10.
+    budget_ratio: float
+        The retries earned back by every request sent. Defaults to 0.2,
+        so retries can not exceed a fifth of the traffic for long.
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        *,
+        backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        deadline: Optional[float] = 30.0,
+        budget: float = 10.0,
+        budget_ratio: float = 0.2,
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.budget = budget
+        self.budget_ratio = budget_ratio
+        self._tokens = budget
+
+    def deadline_for(self, path: str, started: float) -> Optional[float]:
+        """
+        Returns the wall clock time after which a request to the path is not retried anymore.
+        """
+        deadlines = [interaction_deadline.get()]
+        if self.deadline is not None:
+            deadlines.append(started + self.deadline)
+        callback = _CALLBACK.match(path)
+        if callback:
+            deadlines.append(snowflake_time(callback.group(1)) + CALLBACK_WINDOW)
+        deadlines = [deadline for deadline in deadlines if deadline is not None]
+        return min(deadlines) if deadlines else None
+
+    def sent(self):
+        """
+        Records that a request was sent, earning back part of the retry budget.
+        """
+        self._tokens = min(self.budget, self._tokens + self.budget_ratio)
+
+    def retry_after(
+        self,
+        method: str,
+        attempt: int,
+        error: Union[BaseException, int],
+        deadline: Optional[float],
+        *,
+        hint: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Returns the seconds to wait before retrying a failed request, None if it should not be retried.
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method of the request.
+        attempt: int
+            The number of retries already made.
+        error: BaseException | int
+            The exception raised by the request or the status code it was answered with.
+        deadline: float | None
+            The wall clock time by which the request must have completed.
+        hint: float | None
+            The delay suggested by discord with a ``Retry-After`` header.
+        """
+        if attempt >= self.retries or self._tokens < 1:
+            return
+        if isinstance(error, int):
+            retriable = error in _RETRY_STATUSES and method in _IDEMPOTENT
+        elif isinstance(error, aiohttp.ClientConnectorError):
+            # nothing reached discord, this is safe to send again for every method
+            retriable = True
+        else:
+            retriable = method in _IDEMPOTENT and isinstance(
+                error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+            )
+        if not retriable:
+            return
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        if hint is not None:
+            delay = max(delay, hint)
+        if deadline is not None and time.time() + delay >= deadline:
+            return
+        self._tokens -= 1
+        return delay
+
+    def timeout(self, *, upload: bool = False) -> Optional[aiohttp.ClientTimeout]:
+        """
+        Returns the timeout of a single attempt, taken when it is sent.
+
+        Only the deadline of the policy bounds an attempt, the deadlines derived from interactions
+        depend on the local clock agreeing with discord and only stop retries.
+        An upload takes as long as its size requires, it only times out waiting for the response.
+
+        Parameters
+        ----------
+        upload: bool
+            Whether the attempt streams a multipart form.
+        """
+        if self.deadline is None:
+            return
+        if upload:
+            return aiohttp.ClientTimeout(total=None, sock_read=self.deadline)
+        return aiohttp.ClientTimeout(total=self.deadline)
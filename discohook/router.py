@@ -0,0 +1,177 @@
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+from .state import SEPARATOR
+
+if TYPE_CHECKING:
+    from .base import Component
+
+_FIELD = re.compile(r"\{(\w+)(?::(\w+))?\}")
+
+_Route = Tuple[str, "Component", List[Tuple[str, Callable[[str], Any]]]]
+
+_CONVERTERS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "str": (r"[^:]+", str),
+    "int": (r"-?\d+", int),
+    "float": (r"-?\d+(?:\.\d+)?", float),
+}
+
+
+def is_pattern(custom_id: str) -> bool:
+    """
+    Whether a custom id contains ``{name}`` or ``{name:type}`` fields.
+    """
+    return _FIELD.search(custom_id) is not None
+
+
+def format_pattern(pattern: str, values: Dict[str, Any]) -> str:
+    """
+    Fills the fields of a custom id pattern with concrete values.
+
+    Raises
+    ------
+    ValueError
+        If a field has no value or the resulting custom id is longer than 100 characters.
+    """
+
+    def fill(match: "re.Match") -> str:
+        name = match.group(1)
+        if name not in values:
+            raise ValueError(f"no value provided for field `{name}` of `{pattern}`")
+        return str(values[name])
+
+    custom_id = _FIELD.sub(fill, pattern)
+    if len(custom_id) > 100:
+        raise ValueError(f"custom id `{custom_id}` is longer than 100 characters")
+    return custom_id
+
+
+class ComponentRouter:
+    """
+    Routes custom ids such as ``vote:{poll_id}:{choice:int}`` to components.
+
+    Patterns are grouped by the literal prefix before their first field and every group is
+    compiled into a single regular expression, so a lookup is a dictionary hit on the prefix
+    followed by one match, regardless of how many patterns are registered.
+    Fields are typed with ``str`` (default, anything but ``:``), ``int`` or ``float``
+    and passed to the callback as keyword arguments.
+
+    Stateless components are looked up by the custom id before their packed state,
+    which is passed to the callback as the ``state`` keyword argument.
+    """
+
+    def __init__(self):
+        self._stateless: Dict[str, "Component"] = {}
+        self._routes: Dict[str, _Route] = {}
+        self._buckets: Optional[Dict[str, Tuple[Pattern, List[_Route]]]] = None
+        self._lengths: List[int] = []
+
+    def add(self, pattern: str, component: "Component"):
+        """
+        Registers a component under a custom id pattern.
+
+        Parameters
+        ----------
+        pattern: str
+            The custom id pattern.
+        component: Component
+            The component to route matching custom ids to.
+
+        Raises
+        ------
+        ValueError
+            If the pattern uses an unknown type or repeats a field.
+        """
+        fields = []
+        for match in _FIELD.finditer(pattern):
+            name, kind = match.group(1), match.group(2) or "str"
+            if kind not in _CONVERTERS:
+                raise ValueError(f"unknown field type `{kind}` in `{pattern}`")
+            if name in (field for field, _ in fields):
+                raise ValueError(f"field `{name}` is repeated in `{pattern}`")
+            fields.append((name, _CONVERTERS[kind][1]))
+        self._routes[pattern] = (pattern, component, fields)
+        self._buckets = None
+
+    def add_stateless(self, custom_id: str, component: "Component"):
+        """
+        Registers a component that carries its state in the custom id.
+
+        Parameters
+        ----------
+        custom_id: str
+            The static part of the custom id.
+        component: Component
+            The component with a state codec to route matching custom ids to.
+        """
+        self._stateless[custom_id] = component
+
+    def _compile(self):
+        grouped: Dict[str, List[_Route]] = {}
+        for route in self._routes.values():
+            grouped.setdefault(_FIELD.split(route[0], 1)[0], []).append(route)
+        self._buckets = {
+            prefix: (_compile_routes(routes), routes)
+            for prefix, routes in grouped.items()
+        }
+        self._lengths = sorted({len(prefix) for prefix in grouped}, reverse=True)
+
+    def match(self, custom_id: str) -> Optional[Tuple["Component", Dict[str, Any]]]:
+        """
+        Finds the component a custom id routes to.
+
+        Parameters
+        ----------
+        custom_id: str
+            The custom id of the interaction.
+
+        Returns
+        -------
+        Optional[Tuple[Component, Dict[str, Any]]]
+            The component and the converted fields, None if no pattern matches.
+        """
+        if self._stateless:
+            prefix, separator, token = custom_id.rpartition(SEPARATOR)
+            component = self._stateless.get(prefix)
+            if separator and component:
+                # noinspection PyProtectedMember
+                state = component._codec.decode(token)
+                if state is not None:
+                    return component, {"state": state}
+        if not self._routes:
+            return
+        if self._buckets is None:
+            self._compile()
+        for length in self._lengths:
+            bucket = self._buckets.get(custom_id[:length])
+            if not bucket:
+                continue
+            regex, routes = bucket
+            match = regex.fullmatch(custom_id)
+            if not match:
+                continue
+            # the outer group of an alternative is the last one to close
+            index = int(match.lastgroup[1:])
+            _, component, fields = routes[index]
+            return component, {
+                name: convert(match.group(f"r{index}_{name}"))
+                for name, convert in fields
+            }
+
+    def __len__(self) -> int:
+        return len(self._stateless) + len(self._routes)
+
+
+def _compile_routes(routes: List[_Route]) -> Pattern:
+    alternatives = []
+    for index, (pattern, _, _) in enumerate(routes):
+        parts, position = [], 0
+        for match in _FIELD.finditer(pattern):
+            start = match.start()
+            parts.append(re.escape(pattern[position:start]))
+            expression = _CONVERTERS[match.group(2) or "str"][0]
+            parts.append(f"(?P<r{index}_{match.group(1)}>{expression})")
+            position = match.end()
+        parts.append(re.escape(pattern[position:]))
+        alternatives.append(f"(?P<r{index}>{''.join(parts)})")
+    return re.compile("|".join(alternatives))
@@ -0,0 +1,196 @@
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import math
+import re
+from enum import IntEnum
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+
+class Priority(IntEnum):
+    """
+    The priority classes of requests to discord, most urgent first.
+    """
+
+    callback = 0
+    followup = 1
+    rest = 2
+    bulk = 3
+
+
+#: The priority of the requests made in the current context, overriding the one derived from the path.
+request_priority: "contextvars.ContextVar[Optional[Priority]]" = contextvars.ContextVar(
+    "request_priority", default=None
+)
+
+_CALLBACK = re.compile(r"^/interactions/\d+/[^/]+/callback")
+# webhooks addressed by token, which includes interaction followups
+_WEBHOOK = re.compile(r"^/webhooks/\d+/[^/?]+")
+
+_Waiter = Tuple[float, int, asyncio.Future]
+
+
+@contextlib.contextmanager
+def priority(level: Priority) -> Iterator[None]:
+    """
+    Runs the requests made within the block, and the tasks it creates, at a priority.
+
+    Example
+    -------
+    >>> with priority(Priority.bulk):
+    ...     await asyncio.gather(*(channel.send("hi") for channel in channels))
+    """
+    token = request_priority.set(level)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+class Scheduler:
+    """
+    Orders the outbound requests to discord so interaction callbacks never queue behind other traffic.
+
+    Requests other than interaction callbacks share a number of slots and every class can
+    additionally be capped. A request that finds no slot waits, and when one frees up the waiting
+    request of the most urgent class with the earliest deadline goes first.
+    Interaction callbacks never wait.
+
+    The shared slots should be fewer than the ``limit`` of the connector (100 by default),
+    so callbacks always find a free connection.
+
+    Parameters
+    ----------
+    total: int | None
+        The number of requests other than callbacks allowed in flight. Defaults to 80.
+    limits: Dict[Priority, int | None] | None
+        The number of requests of each class allowed in flight, merged over
+        ``{rest: 48, bulk: 16}`` so followups always find a slot and bulk work
+        can not take every slot from other REST requests. None lifts the cap of a class.
+    """
+
+    DEFAULT_LIMITS: Dict[Priority, Optional[int]] = {
+        Priority.callback: None,
+        Priority.followup: None,
+        Priority.rest: 48,
+        Priority.bulk: 16,
+    }
+
+    def __init__(
+        self,
+        total: Optional[int] = 80,
+        limits: Optional[Dict[Priority, Optional[int]]] = None,
+    ):
+        self.total = total
+        self.limits = {**self.DEFAULT_LIMITS, **(limits or {})}
+        self._active = {level: 0 for level in Priority}
+        self._waiters: Dict[Priority, List[_Waiter]] = {level: [] for level in Priority}
+        self._counter = itertools.count()
+
+    @staticmethod
+    def classify(path: str) -> Priority:
+        """
+        Returns the priority of a request to the path.
+
+        Interaction callbacks are always most urgent, otherwise the priority set with
+        :func:`priority` applies, then webhook requests are followups and the rest is REST traffic.
+        """
+        if _CALLBACK.match(path):
+            return Priority.callback
+        level = request_priority.get()
+        if level is not None:
+            return level
+        if _WEBHOOK.match(path):
+            return Priority.followup
+        return Priority.rest
+
+    def _available(self, level: Priority) -> bool:
+        if level == Priority.callback:
+            return True
+        limit = self.limits[level]
+        if limit is not None and self._active[level] >= limit:
+            return False
+        if self.total is None:
+            return True
+        return sum(self._active.values()) - self._active[Priority.callback] < self.total
+
+    def _wake(self):
+        for level in Priority:
+            waiters = self._waiters[level]
+            while waiters and self._available(level):
+                _, _, waiter = heapq.heappop(waiters)
+                if waiter.done() or waiter.get_loop().is_closed():
+                    continue
+                self._active[level] += 1
+                waiter.set_result(None)
+
+    async def acquire(self, level: Priority, deadline: Optional[float] = None):
+        """
+        Waits for a slot of the priority class.
+
+        Parameters
+        ----------
+        level: Priority
+            The priority class of the request.
+        deadline: float | None
+            The wall clock time by which the request must have completed,
+            requests with earlier deadlines are let through first.
+        """
+        queued = any(self._waiters[ahead] for ahead in Priority if ahead <= level)
+        if not queued and self._available(level):
+            self._active[level] += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        key = deadline if deadline is not None else math.inf
+        heapq.heappush(self._waiters[level], (key, next(self._counter), waiter))
+        # drops the waiters cancelled ahead of this one if the class has room
+        self._wake()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was granted as the waiter was cancelled, hand it on
+                self.release(level)
+            raise
+
+    def release(self, level: Priority):
+        """
+        Frees a slot of the priority class.
+        """
+        self._active[level] -= 1
+        self._wake()
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, level: Priority, deadline: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        """
+        Holds a slot of the priority class for the duration of the block.
+        """
+        await self.acquire(level, deadline)
+        try:
+            yield
+        finally:
+            self.release(level)
+
+    def resize(self, total: Optional[int]):
+        """
+        Changes the number of slots shared by requests other than callbacks.
+        Requests in flight beyond a smaller total finish, the next ones wait.
+        """
+        self.total = total
+        self._wake()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the number of requests in flight and waiting of every priority class.
+        """
+        return {
+            level.name: {
+                "active": self._active[level],
+                "waiting": len(self._waiters[level]),
+            }
+            for level in Priority
+        }
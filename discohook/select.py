@@ -117,6 +117,13 @@ class Select(Component):
         Whether the select menu is disabled or not.
     type: :class:`SelectType`
         The type of the select menu.
+    auto_defer: Optional[:class:`float`]
+        Seconds after the interaction was created at which it is deferred automatically.
+    background: :class:`bool`
+        Whether to acknowledge the interaction immediately and run the callback in the background.
+    timeout: Optional[:class:`float`]
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
     """
 
     def __init__(
@@ -128,8 +135,17 @@ class Select(Component):
         max_values: Optional[int] = None,
         disabled: Optional[bool] = False,
         custom_id: Optional[str] = None,
+        auto_defer: Optional[float] = None,
+        background: bool = False,
+        timeout: Optional[float] = None,
     ):
-        super().__init__(ComponentType(type.value), custom_id)
+        super().__init__(
+            ComponentType(type.value),
+            custom_id,
+            auto_defer=auto_defer,
+            background=background,
+            timeout=timeout,
+        )
         self.placeholder: Optional[str] = placeholder
         self.min_values: Optional[int] = min_values
         self.max_values: Optional[int] = max_values
@@ -180,6 +196,9 @@ def channel(
     disabled: Optional[bool] = False,
     default_values: Optional[List[SelectDefaultValue]] = None,
     custom_id: Optional[str] = None,
+    auto_defer: Optional[float] = None,
+    background: bool = False,
+    timeout: Optional[float] = None,
 ):
     """
     A decorator that creates a channel select menu and registers a callback.
@@ -200,6 +219,13 @@ def channel(
         The default values of the select menu.
     custom_id: Optional[:class:`str`]
         The custom id of the select menu.
+    auto_defer: Optional[:class:`float`]
+        Seconds after the interaction was created at which it is deferred automatically.
+    background: :class:`bool`
+        Whether to acknowledge the interaction immediately and run the callback in the background.
+    timeout: Optional[:class:`float`]
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
     """
 
     def decorator(coro: Callable[["Interaction", List["PartialChannel"]], Any]):
@@ -212,6 +238,9 @@ def channel(
             min_values=min_values,
             max_values=max_values,
             disabled=disabled,
+            auto_defer=auto_defer,
+            background=background,
+            timeout=timeout,
         )
         self.channel_types = types
         self.default_values = default_values
@@ -229,6 +258,9 @@ def text(
     max_values: Optional[int] = None,
     disabled: Optional[bool] = False,
     custom_id: Optional[str] = None,
+    auto_defer: Optional[float] = None,
+    background: bool = False,
+    timeout: Optional[float] = None,
 ):
     """
     A decorator that creates a text select menu and registers a callback.
@@ -247,6 +279,13 @@ def text(
         Whether the select menu is disabled or not.
     custom_id: Optional[:class:`str`]
         The custom id of the select menu.
+    auto_defer: Optional[:class:`float`]
+        Seconds after the interaction was created at which it is deferred automatically.
+    background: :class:`bool`
+        Whether to acknowledge the interaction immediately and run the callback in the background.
+    timeout: Optional[:class:`float`]
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
     """
 
     def decorator(coro: Callable[["Interaction", List[str]], Any]):
@@ -259,6 +298,9 @@ def text(
             min_values=min_values,
             max_values=max_values,
             disabled=disabled,
+            auto_defer=auto_defer,
+            background=background,
+            timeout=timeout,
         )
         self.options = options
         self.callback = coro
@@ -275,6 +317,9 @@ def role(
     disabled: Optional[bool] = False,
     default_values: Optional[List[SelectDefaultValue]] = None,
     custom_id: Optional[str] = None,
+    auto_defer: Optional[float] = None,
+    background: bool = False,
+    timeout: Optional[float] = None,
 ):
     """
     A decorator that creates a select menu and registers a callback.
@@ -295,6 +340,13 @@ def role(
         The default values of the select menu.
     custom_id: Optional[:class:`str`]
         The custom id of the select menu.
+    auto_defer: Optional[:class:`float`]
+        Seconds after the interaction was created at which it is deferred automatically.
+    background: :class:`bool`
+        Whether to acknowledge the interaction immediately and run the callback in the background.
+    timeout: Optional[:class:`float`]
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
 
     Raises
     ------
@@ -312,6 +364,9 @@ def role(
             max_values=max_values,
             disabled=disabled,
             custom_id=custom_id,
+            auto_defer=auto_defer,
+            background=background,
+            timeout=timeout,
         )
         self.default_values = default_values
         self.callback = coro
@@ -328,6 +383,9 @@ def user(
     disabled: Optional[bool] = False,
     default_values: Optional[List[SelectDefaultValue]] = None,
     custom_id: Optional[str] = None,
+    auto_defer: Optional[float] = None,
+    background: bool = False,
+    timeout: Optional[float] = None,
 ):
     """
     A decorator that creates a user select menu and registers a callback.
@@ -346,6 +404,13 @@ def user(
         The default values of the select menu.
     custom_id: Optional[:class:`str`]
         The custom id of the select menu.
+    auto_defer: Optional[:class:`float`]
+        Seconds after the interaction was created at which it is deferred automatically.
+    background: :class:`bool`
+        Whether to acknowledge the interaction immediately and run the callback in the background.
+    timeout: Optional[:class:`float`]
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
     """
 
     def decorator(coro: Callable[["Interaction", List["User"]], Any]):
@@ -358,6 +423,9 @@ def user(
             max_values=max_values,
             disabled=disabled,
             custom_id=custom_id,
+            auto_defer=auto_defer,
+            background=background,
+            timeout=timeout,
         )
         self.default_values = default_values
         self.callback = coro
@@ -374,6 +442,9 @@ def mentionable(
     disabled: Optional[bool] = False,
     default_values: Optional[List[SelectDefaultValue]] = None,
     custom_id: Optional[str] = None,
+    auto_defer: Optional[float] = None,
+    background: bool = False,
+    timeout: Optional[float] = None,
 ):
     """
     A decorator that creates a mentionable select menu and registers a callback.
@@ -392,10 +463,17 @@ def mentionable(
         The default values of the select menu.
     custom_id: Optional[:class:`str`]
         The custom id of the select menu.
+    auto_defer: Optional[:class:`float`]
+        Seconds after the interaction was created at which it is deferred automatically.
+    background: :class:`bool`
+        Whether to acknowledge the interaction immediately and run the callback in the background.
+    timeout: Optional[:class:`float`]
+        Seconds of inactivity after which the component is dropped from the client.
+        Defaults to the client's ``component_ttl``.
     """
 
     def decorator(
-        coro: Callable[["Interaction", List[Union["User", "PartialRole"]]], Any]
+        coro: Callable[["Interaction", List[Union["User", "PartialRole"]]], Any],
     ):
         if not asyncio.iscoroutinefunction(coro):
             raise TypeError("Callback must be a coroutine.")
@@ -406,6 +484,9 @@ def mentionable(
             max_values=max_values,
             disabled=disabled,
             custom_id=custom_id,
+            auto_defer=auto_defer,
+            background=background,
+            timeout=timeout,
         )
         self.default_values = default_values
         self.callback = coro
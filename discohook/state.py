@@ -0,0 +1,86 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import struct
+from typing import Any, Optional, Tuple
+
+SEPARATOR = ":"
+_DIGEST_SIZE = 6
+
+
+class StateCodec:
+    """
+    Packs small typed state into a custom id and unpacks it at dispatch time.
+
+    The values are packed with :mod:`struct`, followed by a keyed checksum of the
+    custom id prefix and the packed bytes, and the result is encoded with base85.
+
+    Parameters
+    ----------
+    prefix: str
+        The static part of the custom id.
+    fmt: str
+        The :mod:`struct` format of the state. Little endian without padding if no byte order is given.
+    secret: bytes
+        The key of the checksum. Every replica must share it.
+    """
+
+    def __init__(self, prefix: str, fmt: str, secret: bytes):
+        if fmt[:1] not in ("@", "=", "<", ">", "!"):
+            fmt = "<" + fmt
+        self.prefix = prefix
+        try:
+            self.struct = struct.Struct(fmt)
+        except struct.error as e:
+            raise ValueError(f"invalid state format `{fmt}`: {e}") from None
+        self._key = hashlib.sha256(secret).digest()
+        size = (
+            len(prefix)
+            + len(SEPARATOR)
+            + -(-(self.struct.size + _DIGEST_SIZE) // 4) * 5
+        )
+        if size > 100:
+            raise ValueError(
+                f"state `{fmt}` of `{prefix}` does not fit in a custom id ({size} > 100 characters)"
+            )
+
+    def _digest(self, packed: bytes) -> bytes:
+        return hmac.new(
+            self._key, self.prefix.encode() + packed, hashlib.sha256
+        ).digest()[:_DIGEST_SIZE]
+
+    def encode(self, values: Tuple[Any, ...]) -> str:
+        """
+        Returns the custom id carrying the values.
+
+        Raises
+        ------
+        ValueError
+            If the values do not match the format.
+        """
+        try:
+            packed = self.struct.pack(*values)
+        except struct.error as e:
+            raise ValueError(
+                f"state does not match `{self.struct.format}`: {e}"
+            ) from None
+        token = base64.b85encode(packed + self._digest(packed)).decode()
+        return f"{self.prefix}{SEPARATOR}{token}"
+
+    def decode(self, token: str) -> Optional[Tuple[Any, ...]]:
+        """
+        Returns the values carried by the part of a custom id after the separator,
+        None if it was not produced by this codec.
+        """
+        try:
+            raw = base64.b85decode(token)
+        except (ValueError, binascii.Error):
+            return
+        if len(raw) != self.struct.size + _DIGEST_SIZE:
+            return
+        size = self.struct.size
+        packed, digest = raw[:size], raw[size:]
+        if not hmac.compare_digest(digest, self._digest(packed)):
+            return
+        return self.struct.unpack(packed)
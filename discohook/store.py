@@ -0,0 +1,103 @@
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import TTLCache
+
+
+class EntityStore:
+    """
+    Keeps the users, members, roles and channels that arrive with interactions,
+    so they can be looked up without a request to discord.
+
+    Payloads are stored as received. Resolved channels are partial,
+    they only carry the fields discord includes with interactions.
+
+    Parameters
+    ----------
+    ttl: float
+        Seconds an entity is kept after it was last seen. Defaults to 300.
+    max_size: int
+        The maximum number of entities kept of each kind. Defaults to 10000.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_size: int = 10000):
+        self.users: TTLCache[str, Dict[str, Any]] = TTLCache(max_size, ttl)
+        self.members: TTLCache[Tuple[str, str], Dict[str, Any]] = TTLCache(
+            max_size, ttl
+        )
+        self.roles: TTLCache[str, Dict[str, Any]] = TTLCache(max_size, ttl)
+        self.channels: TTLCache[str, Dict[str, Any]] = TTLCache(max_size, ttl)
+
+    def add_user(self, payload: Dict[str, Any]):
+        self.users.set(payload["id"], payload)
+
+    def add_member(self, guild_id: str, payload: Dict[str, Any]):
+        """
+        Stores a member payload that carries its user under ``user``.
+        """
+        self.add_user(payload["user"])
+        self.members.set((guild_id, payload["user"]["id"]), payload)
+
+    def add_role(self, guild_id: str, payload: Dict[str, Any]):
+        self.roles.set(payload["id"], {**payload, "guild_id": guild_id})
+
+    def add_channel(self, payload: Dict[str, Any], guild_id: Optional[str] = None):
+        if guild_id and "guild_id" not in payload:
+            payload = {**payload, "guild_id": guild_id}
+        self.channels.set(payload["id"], payload)
+
+    def ingest(self, payload: Dict[str, Any]):
+        """
+        Stores every entity carried by an interaction payload.
+
+        Parameters
+        ----------
+        payload: Dict[str, Any]
+            The raw interaction payload.
+        """
+        guild_id = payload.get("guild_id")
+        if payload.get("member") and guild_id:
+            self.add_member(guild_id, payload["member"])
+        elif payload.get("user"):
+            self.add_user(payload["user"])
+        if payload.get("channel"):
+            self.add_channel(payload["channel"], guild_id)
+        resolved = payload.get("data", {}).get("resolved")
+        if not resolved:
+            return
+        users = resolved.get("users", {})
+        for user in users.values():
+            self.add_user(user)
+        if guild_id:
+            for user_id, member in resolved.get("members", {}).items():
+                if user_id in users:
+                    self.add_member(guild_id, {**member, "user": users[user_id]})
+            for role in resolved.get("roles", {}).values():
+                self.add_role(guild_id, role)
+        for channel in resolved.get("channels", {}).values():
+            self.add_channel(channel, guild_id)
+        for message in resolved.get("messages", {}).values():
+            if message.get("author"):
+                self.add_user(message["author"])
+
+    def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return self.users.get(user_id)
+
+    def get_member(self, guild_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        return self.members.get((guild_id, user_id))
+
+    def get_role(self, role_id: str) -> Optional[Dict[str, Any]]:
+        return self.roles.get(role_id)
+
+    def get_channel(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        return self.channels.get(channel_id)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the stats of the cache of every kind of entity.
+        """
+        return {
+            "users": self.users.stats(),
+            "members": self.members.stats(),
+            "roles": self.roles.stats(),
+            "channels": self.channels.stats(),
+        }
@@ -1,10 +1,9 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import aiohttp
-
 from .asset import Asset
 from .embed import Embed
 from .file import File
+from .https import HTTPResponse
 from .params import _SendingPayload
 
 if TYPE_CHECKING:
@@ -135,7 +134,7 @@ class User:
         embeds: Optional[List[Embed]] = None,
         file: Optional[File] = None,
         files: Optional[List[File]] = None,
-    ) -> aiohttp.ClientResponse:
+    ) -> HTTPResponse:
         """
         Sends a message to the user.
 
@@ -165,4 +164,4 @@ class User:
         resp = await self.client.http.create_dm_channel({"recipient_id": self.id})
         data = await resp.json()
         channel_id = data["id"]
-        return await self.client.http.send_message(channel_id, payload.to_form())
+        return await self.client.http.send_message(channel_id, payload.to_body())
@@ -1,9 +1,12 @@
 import hashlib
-import json
+import inspect
 import secrets
-from typing import Any, Callable, Coroutine, Union
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
+
+from . import codec
 
 Handler = Callable[["Interaction", Any], Coroutine[Any, Any, Any]]
+Binder = Callable[[Dict[str, Any]], Tuple[List[Any], Dict[str, Any]]]
 
 
 def compare_password(local: str, remote: str) -> bool:
@@ -34,8 +37,37 @@ def find_description(name: str, description: Any, callback: Handler) -> str:
 
 
 def unwrap_user(data: dict, guild_id: str) -> dict:
-    member = json.loads(json.dumps(data))
+    member = codec.loads(codec.dumps(data))
     user: dict = member.pop("user")
     member.update(user)
     member["guild_id"] = guild_id
     return member
+
+
+def make_binder(func: Optional[Callable], skips: int = 1) -> Binder:
+    """
+    Inspects the signature of a callback once and returns a function
+    that maps parsed options to the positional and keyword arguments of the callback.
+    """
+    if not func:
+        return lambda options: ([], {})
+    spec = inspect.getfullargspec(func)
+    names = spec.args[skips:]
+    defaults = list(spec.defaults or [])
+    defaults = [None] * (len(names) - len(defaults)) + defaults
+    positional = list(zip(names, defaults))
+    kwonly_defaults = spec.kwonlydefaults or {}
+    keywords = [(kw, kwonly_defaults.get(kw)) for kw in spec.kwonlyargs]
+
+    def bind(options: Dict[str, Any]) -> Tuple[List[Any], Dict[str, Any]]:
+        args = []
+        for name, default in positional:
+            value = options.get(name)
+            args.append(default if value is None else value)
+        kwargs = {}
+        for name, default in keywords:
+            value = options.get(name)
+            kwargs[name] = default if value is None else value
+        return args, kwargs
+
+    return bind
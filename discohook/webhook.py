@@ -1,12 +1,11 @@
 from typing import TYPE_CHECKING, List, Optional
 
-import aiohttp
-
 from .asset import Asset
 from .channel import PartialChannel
 from .embed import Embed
 from .file import File
 from .guild import PartialGuild
+from .https import HTTPResponse
 from .message import Message
 from .params import MISSING, _EditingPayload, _SendingPayload
 from .user import User
@@ -71,7 +70,7 @@ class PartialWebhook:
 
         Returns
         -------
-        aiohttp.ClientResponse
+        HTTPResponse
         """
         payload = _SendingPayload(
             content=content,
@@ -95,7 +94,7 @@ class PartialWebhook:
         if thread_id:
             params["thread_id"] = thread_id
         resp = await self.client.http.execute_webhook(
-            self.id, self.token, form=payload.to_form(**extras), params=params
+            self.id, self.token, payload=payload.to_body(**extras), params=params
         )
         if wait:
             data = await resp.json()
@@ -308,7 +307,7 @@ class Webhook:
         if view:
             self.client.load_view(view)
         return await self.client.http.send_webhook_message(
-            self.id, self.token, payload.to_form(**extras)
+            self.id, self.token, payload.to_body(**extras)
         )
 
     async def edit_message(
@@ -357,12 +356,12 @@ class Webhook:
         if view:
             self.client.load_view(view)
         resp = await self.client.http.edit_webhook_message(
-            self.id, self.token, message_id, payload.to_form()
+            self.id, self.token, message_id, payload.to_body()
         )
         data = await resp.json()
         return Message(self.client, data)
 
-    async def delete_message(self, message_id: str) -> aiohttp.ClientResponse:
+    async def delete_message(self, message_id: str) -> HTTPResponse:
         """
         Deletes a message from the webhook.
 
@@ -373,7 +372,7 @@ class Webhook:
 
         Returns
         -------
-        aiohttp.ClientResponse
+        HTTPResponse
         """
         return await self.client.http.delete_webhook_message(
             self.id, self.token, message_id
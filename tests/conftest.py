@@ -0,0 +1,149 @@
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import pytest
+from aiohttp import web
+from nacl.signing import SigningKey
+from starlette.testclient import TestClient
+
+import discohook
+
+SIGNING_KEY = SigningKey.generate()
+PUBLIC_KEY = SIGNING_KEY.verify_key.encode().hex()
+APPLICATION_ID = "1000000000000000001"
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class Recorded:
+    """
+    A request received by :class:`FakeDiscord`.
+    """
+
+    def __init__(self, method: str, path: str, headers: Dict[str, str], body: Any):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+        self.at = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"<Recorded {self.method} {self.path} {self.body!r}>"
+
+
+class FakeDiscord:
+    """
+    A local stand-in for the discord API, served from its own thread and event loop
+    so the client under test can run on any loop.
+
+    Every request is recorded. Responses come from ``handler``, which answers every
+    request with an empty message object unless it is replaced.
+    """
+
+    def __init__(self):
+        self.requests: List[Recorded] = []
+        self.handler: Handler = self.default_handler
+        self.url = ""
+        self._loop = asyncio.new_event_loop()
+        self._runner: Optional[web.AppRunner] = None
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    @staticmethod
+    async def default_handler(request: web.Request) -> web.StreamResponse:
+        if request.method == "DELETE":
+            return web.Response(status=204)
+        return web.json_response({"id": "2000000000000000002", "channel_id": "5"})
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        raw = await request.read()
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            body = raw
+        path = request.path.split("/api/v10", 1)[-1]
+        self.requests.append(
+            Recorded(request.method, path, dict(request.headers), body)
+        )
+        return await self.handler(request)
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    def start(self):
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def sent(self) -> List[Recorded]:
+        """
+        The recorded requests, without the warm-up of the session at startup.
+        """
+        return [r for r in self.requests if r.path != "/gateway"]
+
+
+def snowflake() -> str:
+    return str((int(time.time() * 1000) - 1420070400000) << 22)
+
+
+def command_payload(name: str, **extra) -> Dict[str, Any]:
+    return {
+        "type": 2,
+        "id": snowflake(),
+        "token": "token",
+        "application_id": APPLICATION_ID,
+        "version": 1,
+        "channel_id": "5",
+        "data": {"id": "9", "name": name, "type": 1},
+        **extra,
+    }
+
+
+def interact(client: TestClient, payload: Dict[str, Any]):
+    """
+    Posts a signed interaction to the application.
+    """
+    body = json.dumps(payload).encode()
+    timestamp = str(int(time.time()))
+    signature = SIGNING_KEY.sign(timestamp.encode() + body).signature.hex()
+    return client.post(
+        "/interactions",
+        content=body,
+        headers={"X-Signature-Ed25519": signature, "X-Signature-Timestamp": timestamp},
+    )
+
+
+@pytest.fixture
+def discord():
+    fake = FakeDiscord()
+    fake.start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture
+def make_client(discord: FakeDiscord):
+    def make(**kwargs) -> discohook.Client:
+        client = discohook.Client(
+            application_id=APPLICATION_ID,
+            public_key=PUBLIC_KEY,
+            token="token",
+            **kwargs,
+        )
+        client.http.BASE_URL = discord.url
+        return client
+
+    return make
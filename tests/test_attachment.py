@@ -0,0 +1,39 @@
+import asyncio
+
+from aiohttp import web
+
+from discohook.attachment import Attachment
+
+
+def test_downloads_do_not_take_api_connections(make_client, discord):
+    async def handler(request: web.Request):
+        if request.path == "/file":
+            return web.Response(body=b"content")
+        await asyncio.sleep(0.5)
+        return web.json_response({"id": "1"})
+
+    discord.handler = handler
+    client = make_client(connector_options={"limit": 1})
+    attachment = Attachment(
+        client,
+        {
+            "id": "1",
+            "filename": "file",
+            "size": 7,
+            "url": f"{discord.url}/file",
+            "proxy_url": f"{discord.url}/file",
+        },
+    )
+
+    async def main():
+        try:
+            # holds the only connection of the api session
+            slow = asyncio.create_task(client.http.request("GET", "/users/1"))
+            await asyncio.sleep(0.05)
+            content = await asyncio.wait_for(attachment.read(), 0.3)
+            await slow
+            return content
+        finally:
+            await client.http.close()
+
+    assert asyncio.run(main()) == b"content"
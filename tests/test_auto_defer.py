@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+from starlette.testclient import TestClient
+
+import discohook
+
+from .conftest import APPLICATION_ID, command_payload, interact
+
+ORIGINAL = f"/webhooks/{APPLICATION_ID}/token/messages/@original"
+FOLLOWUP = f"/webhooks/{APPLICATION_ID}/token"
+
+
+def late_reply(**send_kwargs):
+    async def late(interaction: discohook.Interaction):
+        # outlives the auto defer
+        await asyncio.sleep(0.2)
+        await interaction.response.send("late", **send_kwargs)
+
+    return late
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_ephemeral_reply_after_public_defer_is_a_followup(
+    make_client, discord, background
+):
+    client = make_client()
+    command = discohook.command.slash(
+        "late", description="d", auto_defer=0, background=background
+    )(late_reply(ephemeral=True))
+    client.load(command)
+    with TestClient(client) as tc:
+        assert interact(tc, command_payload("late")).status_code == 200
+    callback, *rest = discord.sent()
+    assert callback.body == {"type": 5}
+    assert [(r.method, r.path) for r in rest] == [
+        ("DELETE", ORIGINAL),
+        ("POST", FOLLOWUP),
+    ]
+    assert rest[1].body["flags"] == 64
+
+
+def test_reply_matching_ephemeral_defer_edits_it(make_client, discord):
+    client = make_client()
+    command = discohook.command.slash(
+        "late", description="d", auto_defer=0, auto_defer_ephemeral=True
+    )(
+        late_reply(
+            ephemeral=True,
+            allowed_mentions=discohook.AllowedMentions(parse=[]),
+        )
+    )
+    client.load(command)
+    with TestClient(client) as tc:
+        interact(tc, command_payload("late"))
+    callback, edit = discord.sent()
+    assert callback.body == {"type": 5, "data": {"flags": 64}}
+    assert (edit.method, edit.path) == ("PATCH", ORIGINAL)
+    assert edit.body["content"] == "late"
+    assert "allowed_mentions" in edit.body
+
+
+def test_ephemeral_background_defer(make_client, discord):
+    client = make_client()
+    command = discohook.command.slash(
+        "late", description="d", background=True, auto_defer_ephemeral=True
+    )(late_reply(ephemeral=True))
+    client.load(command)
+    with TestClient(client) as tc:
+        interact(tc, command_payload("late"))
+    callback, edit = discord.sent()
+    assert callback.body == {"type": 5, "data": {"flags": 64}}
+    assert (edit.method, edit.path) == ("PATCH", ORIGINAL)
+
+
+def test_shutdown_waits_for_background_callbacks(make_client, discord):
+    client = make_client()
+    command = discohook.command.slash("late", description="d", background=True)(
+        late_reply()
+    )
+    client.load(command)
+    with TestClient(client) as tc:
+        interact(tc, command_payload("late"))
+        # the callback is still sleeping when the application shuts down
+        assert len(discord.sent()) == 1
+    assert [r.method for r in discord.sent()] == ["POST", "PATCH"]
@@ -0,0 +1,31 @@
+import time
+
+import discohook
+from discohook.cache import TTLCache
+
+
+def test_pinned_key_survives_set(monkeypatch):
+    now = [time.monotonic()]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = TTLCache(max_size=1, ttl=10)
+    cache.pin("pinned", 1)
+    cache.set("pinned", 2)
+    cache.set("other", 3)
+    cache.set("another", 4)
+    now[0] += 60
+    assert cache.get("pinned") == 2
+    assert cache.get("another") is None
+
+
+def test_preloaded_component_survives_load_view(monkeypatch, make_client):
+    now = [time.monotonic()]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    client = make_client(component_ttl=5)
+    persistent = client.preload("persistent")(discohook.Button("persistent"))
+    temporary = discohook.Button("temporary", custom_id="temporary")
+    view = discohook.View()
+    view.add_buttons(persistent, temporary)
+    client.load_view(view)
+    now[0] += 60
+    assert client.active_components.get("persistent") is persistent
+    assert client.active_components.get("temporary") is None
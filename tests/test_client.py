@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from starlette.testclient import TestClient
+
+import discohook
+from discohook import codec
+
+
+def test_placeholder_public_key_is_only_parsed_when_verifying():
+    client = discohook.Client(application_id="1", public_key="", token="token")
+    with pytest.raises(ValueError, match="public key"):
+        client._verify_request("00" * 64, "1", b"{}")
+
+
+def test_async_generator_lifespan(make_client, discord):
+    events = []
+
+    async def lifespan(_):
+        events.append("startup")
+        yield
+        events.append("shutdown")
+
+    client = make_client(lifespan=lifespan)
+    with TestClient(client):
+        assert events == ["startup"]
+    assert events == ["startup", "shutdown"]
+
+
+def test_sync_generator_lifespan_is_rejected():
+    def lifespan(_):
+        yield
+
+    with pytest.raises(TypeError, match="lifespan"):
+        discohook.Client(
+            application_id="1", public_key="", token="token", lifespan=lifespan
+        )
+
+
+def test_default_client_keeps_an_explicit_codec(make_client, discord):
+    previous = codec.get_codec()
+    try:
+        explicit = codec.JSONCodec.from_name("json")
+        first = make_client(json_codec=explicit)
+        second = make_client()
+        assert codec.get_codec() is explicit
+        assert first.codec is explicit and second.codec is explicit
+    finally:
+        codec.set_codec(previous)
+
+
+def test_requests_use_the_codec_of_the_client(make_client, discord):
+    used = []
+    base = codec.JSONCodec.from_name("json")
+
+    def dumps(obj):
+        used.append("dumps")
+        return base.dumps(obj)
+
+    def loads(data):
+        used.append("loads")
+        return base.loads(data)
+
+    previous = codec.get_codec()
+    try:
+        client = make_client(json_codec=codec.JSONCodec("spy", dumps, loads))
+    finally:
+        codec.set_codec(previous)
+
+    async def main():
+        try:
+            resp = await client.http.request("POST", "/channels/1/messages", json={})
+            return resp.data
+        finally:
+            await client.http.close()
+
+    assert asyncio.run(main())["id"]
+    assert used == ["dumps", "loads"]
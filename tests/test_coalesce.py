@@ -0,0 +1,28 @@
+import asyncio
+
+from discohook.coalesce import EditCoalescer
+
+
+def test_edits_made_while_a_request_is_queued_go_into_the_next_one():
+    sent = []
+
+    async def send(payload):
+        # the payload is already fixed while the request waits for its bucket
+        sent.append(dict(payload))
+        await asyncio.sleep(0.1)
+        return len(sent)
+
+    async def main():
+        coalescer = EditCoalescer(interval=0.05)
+        first = asyncio.create_task(coalescer.submit("m", {"content": "1"}, send))
+        await asyncio.sleep(0.01)
+        later = [
+            asyncio.create_task(coalescer.submit("m", body, send))
+            for body in ({"content": "2"}, {"content": "3", "embeds": []})
+        ]
+        return await asyncio.gather(first, *later), coalescer.stats()
+
+    results, stats = asyncio.run(main())
+    assert sent == [{"content": "1"}, {"content": "3", "embeds": []}]
+    assert results == [1, 2, 2]
+    assert (stats["submitted"], stats["sent"]) == (3, 2)
@@ -0,0 +1,53 @@
+import asyncio
+import io
+from email.parser import BytesParser
+from email.policy import HTTP
+
+import pytest
+
+import discohook
+from discohook.channel import PartialChannel
+
+
+def uploaded(recorded):
+    # the fake records the raw multipart body, parsed here as a MIME message
+    head = f"Content-Type: {recorded.headers['Content-Type']}\r\n\r\n".encode()
+    message = BytesParser(policy=HTTP).parsebytes(head + recorded.body)
+    return {
+        part.get_filename(): part.get_payload(decode=True)
+        for part in message.iter_parts()
+        if part.get_filename()
+    }
+
+
+async def chunks():
+    for chunk in (b"async ", b"iterable"):
+        yield chunk
+
+
+@pytest.mark.parametrize("as_str", [False, True])
+def test_upload_round_trip(make_client, discord, tmp_path, as_str):
+    path = tmp_path / "disk.txt"
+    path.write_bytes(b"from disk" * 10000)
+    client = make_client()
+    files = [
+        discohook.File("bytes.txt", content=b"raw bytes"),
+        discohook.File("disk.txt", content=str(path) if as_str else path),
+        discohook.File("object.txt", content=io.BytesIO(b"file object")),
+        discohook.File("stream.txt", content=chunks()),
+    ]
+
+    async def main():
+        try:
+            await PartialChannel(client, "1").send("files", files=files)
+        finally:
+            await client.http.close()
+
+    asyncio.run(main())
+    (recorded,) = discord.sent()
+    assert uploaded(recorded) == {
+        "bytes.txt": b"raw bytes",
+        "disk.txt": b"from disk" * 10000,
+        "object.txt": b"file object",
+        "stream.txt": b"async iterable",
+    }
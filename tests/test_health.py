@@ -0,0 +1,50 @@
+import asyncio
+import random
+
+import pytest
+
+from discohook.errors import CircuitOpen
+from discohook.health import AdaptiveLimit
+
+from .conftest import snowflake
+
+
+def test_steady_healthy_latency_keeps_the_limit_at_its_maximum():
+    rng = random.Random(0)
+    limit = AdaptiveLimit(80)
+    limits = [limit.record(False, rng.uniform(0.06, 0.3)) for _ in range(20000)]
+    assert min(limits) == 80
+    assert limit.stats()["decreases"] == 0
+
+
+def test_only_a_lasting_slowdown_shrinks_the_limit():
+    limit = AdaptiveLimit(80)
+    for _ in range(500):
+        limit.record(False, 0.1)
+    for _ in range(5):
+        limit.record(False, 1.0)
+    assert limit.record(False, 0.1) == 80
+    for _ in range(20):
+        limit.record(False, 1.0)
+    assert limit.stats()["decreases"] == 1
+
+
+def test_callbacks_bypass_an_open_circuit(make_client, discord):
+    client = make_client()
+    breaker = client.http.breaker
+    for _ in range(breaker.failures):
+        breaker.record(False)
+
+    async def main():
+        try:
+            await client.http.request(
+                "POST", f"/interactions/{snowflake()}/token/callback", json={"type": 5}
+            )
+            with pytest.raises(CircuitOpen):
+                await client.http.request("GET", "/channels/1", authorize=True)
+        finally:
+            await client.http.close()
+
+    asyncio.run(main())
+    assert [r.path.rsplit("/", 1)[-1] for r in discord.sent()] == ["callback"]
+    assert breaker.state == breaker.OPEN
@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+from aiohttp import web
+
+from discohook import RetryPolicy, https
+from discohook.retry import interaction_deadline
+from discohook.scheduler import Priority, priority, request_priority
+
+
+def test_warm_up_does_not_hold_startup(make_client, discord, monkeypatch):
+    monkeypatch.setattr(https, "WARM_UP_TIMEOUT", 0.1)
+
+    async def handler(_):
+        await asyncio.sleep(1)
+        return web.json_response({})
+
+    discord.handler = handler
+    client = make_client()
+
+    async def main():
+        started = time.monotonic()
+        await client.http.start()
+        elapsed = time.monotonic() - started
+        await client.http.close()
+        return elapsed
+
+    assert asyncio.run(main()) < 0.5
+
+
+def test_queueing_does_not_shorten_the_attempt(make_client, discord):
+    served = []
+
+    async def handler(_):
+        if served:
+            await asyncio.sleep(0.3)
+        served.append(None)
+        headers = {
+            "X-RateLimit-Bucket": "bucket",
+            "X-RateLimit-Limit": "1",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset-After": "0.4",
+        }
+        return web.json_response({"id": "1"}, headers=headers)
+
+    discord.handler = handler
+    client = make_client(retry_policy=RetryPolicy(deadline=0.6))
+
+    async def main():
+        try:
+            for i in range(2):
+                await client.http.request(
+                    "GET", f"/channels/1/messages/10000000000000000{i}"
+                )
+        finally:
+            await client.http.close()
+
+    # the second request waits 0.4s for the bucket, then 0.3s for its response
+    asyncio.run(main())
+    assert len(discord.sent()) == 2
+
+
+def test_uploads_are_not_bounded_in_total():
+    timeout = RetryPolicy(deadline=30).timeout(upload=True)
+    assert timeout.total is None
+    assert timeout.sock_read == 30
+
+
+def test_shared_read_does_not_inherit_the_first_caller_context(make_client, discord):
+    client = make_client()
+    seen = []
+    classify = client.http.scheduler.classify
+
+    def spy(path: str):
+        seen.append((request_priority.get(), interaction_deadline.get()))
+        return classify(path)
+
+    client.http.scheduler.classify = spy
+
+    async def bulk_caller():
+        interaction_deadline.set(time.time() + 1)
+        with priority(Priority.bulk):
+            return await client.http.request("GET", "/channels/1")
+
+    async def main():
+        try:
+            return await asyncio.gather(
+                bulk_caller(), client.http.request("GET", "/channels/1")
+            )
+        finally:
+            await client.http.close()
+
+    first, second = asyncio.run(main())
+    assert first is second
+    assert len(discord.sent()) == 1
+    assert seen == [(None, None)]
@@ -0,0 +1,35 @@
+import asyncio
+import gc
+import warnings
+
+import pytest
+
+from discohook.errors import WorkerPoolFull
+from discohook.pool import WorkerPool
+
+
+def test_rejected_callback_is_never_started():
+    started = []
+
+    async def callback(name: str):
+        started.append(name)
+        await asyncio.sleep(0.01)
+
+    async def main():
+        pool = WorkerPool(workers=1, queue_size=1)
+        pool.submit(callback, "running")
+        # the worker picks up the first callback, the second one waits in the queue
+        await asyncio.sleep(0)
+        pool.submit(callback, "queued")
+        with pytest.raises(WorkerPoolFull):
+            pool.submit(callback, "rejected")
+        await pool.close()
+        return pool.stats()
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        stats = asyncio.run(main())
+        gc.collect()
+    assert started == ["running", "queued"]
+    assert (stats["completed"], stats["rejected"]) == (2, 1)
+    assert not [w for w in caught if issubclass(w.category, RuntimeWarning)]
@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+from aiohttp import web
+
+from discohook.ratelimit import RateLimiter
+
+MESSAGE = "/channels/1/messages/100000000000000001"
+OTHER_MESSAGE = "/channels/1/messages/100000000000000002"
+OTHER_CHANNEL = "/channels/2/messages/100000000000000001"
+
+
+def limited(bucket: str, remaining: int, reset_after: float, status: int = 200, **body):
+    headers = {
+        "X-RateLimit-Bucket": bucket,
+        "X-RateLimit-Limit": "1",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset-After": str(reset_after),
+    }
+    return web.json_response(body or {"id": "1"}, status=status, headers=headers)
+
+
+def run(client, *paths: str, authorize: bool = True):
+    async def main():
+        try:
+            for path in paths:
+                await client.http.request("GET", path, authorize=authorize)
+        finally:
+            await client.http.close()
+
+    asyncio.run(main())
+
+
+def test_waits_for_exhausted_bucket(make_client, discord):
+    async def handler(_):
+        return limited("bucket", 0, 0.3)
+
+    discord.handler = handler
+    run(
+        make_client(),
+        MESSAGE,
+        OTHER_MESSAGE,
+    )
+    first, second = discord.sent()
+    assert second.at - first.at >= 0.25
+
+
+def test_buckets_are_kept_per_major_parameter(make_client, discord):
+    async def handler(_):
+        return limited("bucket", 0, 1)
+
+    discord.handler = handler
+    run(
+        make_client(),
+        MESSAGE,
+        OTHER_CHANNEL,
+    )
+    first, second = discord.sent()
+    assert second.at - first.at < 0.5
+
+
+def test_retries_after_429(make_client, discord):
+    responses = [
+        limited("bucket", 0, 0.2, status=429, retry_after=0.2, **{"global": False}),
+        limited("bucket", 0, 0.2),
+    ]
+
+    async def handler(_):
+        return responses.pop(0)
+
+    discord.handler = handler
+    run(make_client(), MESSAGE)
+    first, second = discord.sent()
+    assert second.at - first.at >= 0.15
+
+
+def test_global_429_holds_every_route(make_client, discord):
+    responses = [
+        web.json_response(
+            {"retry_after": 0.3, "global": True},
+            status=429,
+            headers={"X-RateLimit-Global": "true"},
+        )
+    ]
+
+    async def handler(_):
+        if responses:
+            return responses.pop(0)
+        return web.json_response({"id": "1"})
+
+    discord.handler = handler
+    client = make_client()
+
+    async def main():
+        try:
+            await asyncio.gather(
+                client.http.request("GET", MESSAGE, authorize=True),
+                after(0.05, "/guilds/1/roles"),
+            )
+        finally:
+            await client.http.close()
+
+    async def after(delay: float, path: str):
+        await asyncio.sleep(delay)
+        await client.http.request("GET", path, authorize=True)
+
+    asyncio.run(main())
+    limited_at = discord.sent()[0].at
+    assert sorted(r.path for r in discord.sent()[1:]) == [MESSAGE, "/guilds/1/roles"]
+    assert all(r.at - limited_at >= 0.25 for r in discord.sent()[1:])
+
+
+def test_buckets_of_used_up_tokens_are_forgotten(make_client, discord):
+    async def handler(_):
+        return limited("webhook", 4, 0.01)
+
+    discord.handler = handler
+    client = make_client()
+    paths = [f"/webhooks/1/token{i}/messages/100000000000000001" for i in range(200)]
+    run(client, *paths, authorize=False)
+    limiter: RateLimiter = client.http.ratelimiter
+    assert len(discord.sent()) == 200
+    # every token had a bucket under its route and under the hash discord reported
+    assert len(limiter._buckets) < 130
+    time.sleep(0.05)
+    limiter.sweep()
+    assert not limiter._buckets
+
+
+def test_busy_bucket_is_not_forgotten():
+    async def main():
+        limiter = RateLimiter()
+        route, major = await limiter.acquire("GET", MESSAGE)
+        limiter.update(
+            route,
+            major,
+            {
+                "X-RateLimit-Bucket": "bucket",
+                "X-RateLimit-Limit": "1",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset-After": "0.2",
+            },
+        )
+        waiter = asyncio.create_task(limiter.acquire("GET", OTHER_MESSAGE))
+        await asyncio.sleep(0.01)
+        assert limiter.sweep() == 0
+        await waiter
+        assert limiter.sweep() == 0
+        await asyncio.sleep(0.35)
+        assert limiter.sweep() == 2
+
+    asyncio.run(main())
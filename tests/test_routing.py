@@ -0,0 +1,67 @@
+from starlette.testclient import TestClient
+
+import discohook
+
+from .conftest import command_payload, interact
+
+
+def subcommand_payload(name: str, subcommand: str, interaction_type: int = 2):
+    payload = command_payload(name, type=interaction_type)
+    payload["data"]["options"] = [{"type": 1, "name": subcommand, "options": []}]
+    return payload
+
+
+def test_handlers_attached_after_load_are_routed(make_client, discord):
+    client = make_client()
+    calls = []
+
+    @discohook.command.slash("group", description="d")
+    async def group(_):
+        pass
+
+    client.load(group)
+
+    @group.subcommand("child", "d")
+    async def child(interaction: discohook.Interaction):
+        calls.append("child")
+        await interaction.response.send("child")
+
+    @child.on_autocomplete
+    async def complete(interaction: discohook.Interaction):
+        calls.append("complete")
+        await interaction.response.autocomplete([])
+
+    with TestClient(client) as tc:
+        interact(tc, subcommand_payload("group", "child"))
+        interact(tc, subcommand_payload("group", "child", interaction_type=4))
+    assert calls == ["child", "complete"]
+
+
+def test_reloading_a_command_replaces_its_routes(make_client, discord):
+    client = make_client()
+    calls = []
+
+    async def noop(_):
+        pass
+
+    def reply(name: str):
+        async def callback(interaction: discohook.Interaction):
+            calls.append(name)
+            await interaction.response.send(name)
+
+        return callback
+
+    old = discohook.command.slash("group", description="d")(noop)
+    old.subcommand("old", "d")(reply("old"))
+    client.load(old)
+    new = discohook.command.slash("group", description="d")(noop)
+    new.subcommand("new", "d")(reply("new"))
+    client.load(new)
+    # the replaced command no longer reaches the client
+    old.subcommand("late", "d")(reply("late"))
+
+    with TestClient(client, raise_server_exceptions=False) as tc:
+        assert interact(tc, subcommand_payload("group", "new")).status_code == 200
+        assert interact(tc, subcommand_payload("group", "old")).status_code == 500
+        assert interact(tc, subcommand_payload("group", "late")).status_code == 500
+    assert calls == ["new"]